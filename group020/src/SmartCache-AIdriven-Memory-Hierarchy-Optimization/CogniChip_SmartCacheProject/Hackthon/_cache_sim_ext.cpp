@@ -0,0 +1,183 @@
+/*
+ * SmartCache Simulator - Native Trace Replay Extension
+ * =====================================================
+ * C++ version of the replay kernels in cache_simulator_numba.py, operating
+ * on the same SoA tag/age buffers as CacheSimulator. The associativity
+ * is a template parameter for the common power-of-two cases so the
+ * compiler fully unrolls (and vectorizes) the per-set way scans. Set
+ * indexing uses shift/mask, falling back to division only for set
+ * counts that are not a power of two. Traces may be int64 or uint32; the
+ * narrower type is replayed in place rather than widened to a copy.
+ *
+ * Build:  python setup.py build_ext --inplace
+ * Enable: CACHE_SIM_NATIVE=1
+ */
+
+#include <cstdint>
+#include <stdexcept>
+#include <utility>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+namespace py = pybind11;
+
+namespace {
+
+/*
+ * Look up tag in one set and update it as an LRU access
+ * (_access_set in cache_simulator_numba.py). Returns true on a hit.
+ */
+template <int ASSOC>
+inline bool access_set(int64_t* set_tags, int32_t* set_age, int ways,
+                       int64_t tag, int64_t tick) {
+    if (ASSOC > 0) {
+        ways = ASSOC;
+    }
+
+    // Branchless way search (see cache_simulator_numba.py)
+    int found = -1;
+    int victim = 0;
+    int32_t min_age = set_age[0];
+    for (int way = 0; way < ways; ++way) {
+        found = set_tags[way] == tag ? way : found;
+    }
+    for (int way = 1; way < ways; ++way) {
+        const bool better = set_age[way] < min_age;
+        victim = better ? way : victim;
+        min_age = better ? set_age[way] : min_age;
+    }
+
+    const bool is_hit = found >= 0;
+    const int slot = is_hit ? found : victim;
+    set_tags[slot] = tag;
+    set_age[slot] = static_cast<int32_t>(tick);
+    return is_hit;
+}
+
+/*
+ * Replay n addresses through an LRU cache.
+ *
+ * tags[set * assoc + way] holds the stored tag (-1 = invalid way) and
+ * age[set * assoc + way] the tick of its last access; the way with the
+ * minimum age is the LRU victim. With POW2_SETS the set index and tag are
+ * bit fields of the address; otherwise they are the remainder and
+ * quotient of the block address divided by num_sets. Returns the number
+ * of hits and advances *tick by n.
+ */
+template <int ASSOC, bool POW2_SETS, typename Addr>
+uint64_t run_trace_impl(const Addr* addrs, size_t n, int64_t* tags,
+                        int32_t* age, int assoc, int64_t num_sets,
+                        int offset_bits, int index_bits, int64_t* tick) {
+    const int ways = ASSOC > 0 ? ASSOC : assoc;
+    const int64_t index_mask = (int64_t{1} << index_bits) - 1;
+    const int tag_shift = offset_bits + index_bits;
+    int64_t t = *tick;
+    uint64_t hits = 0;
+
+    for (size_t i = 0; i < n; ++i) {
+        const int64_t address = static_cast<int64_t>(addrs[i]);
+        int64_t index;
+        int64_t tag;
+        if (POW2_SETS) {
+            index = (address >> offset_bits) & index_mask;
+            tag = address >> tag_shift;
+        } else {
+            const int64_t block = address >> offset_bits;
+            index = block % num_sets;
+            tag = block / num_sets;
+        }
+        ++t;
+        hits += access_set<ASSOC>(tags + index * ways, age + index * ways,
+                                  ways, tag, t);
+    }
+
+    *tick = t;
+    return hits;
+}
+
+template <typename Addr, int ExtraFlags>
+std::pair<uint64_t, int64_t> run_trace(
+        py::array_t<Addr, py::array::c_style | ExtraFlags> trace,
+        py::array_t<int64_t, py::array::c_style> tags,
+        py::array_t<int32_t, py::array::c_style> age,
+        int64_t tick, int offset_bits, int index_bits) {
+    if (tags.ndim() != 2 || age.ndim() != 2 ||
+        tags.shape(0) != age.shape(0) || tags.shape(1) != age.shape(1)) {
+        throw std::invalid_argument(
+            "tags and age must be matching (num_sets, associativity) arrays");
+    }
+
+    const Addr* addrs = trace.data();
+    const size_t n = static_cast<size_t>(trace.size());
+    int64_t* tag_buf = tags.mutable_data();
+    int32_t* age_buf = age.mutable_data();
+    const int assoc = static_cast<int>(tags.shape(1));
+    const int64_t num_sets = static_cast<int64_t>(tags.shape(0));
+    uint64_t hits;
+
+    {
+        py::gil_scoped_release release;
+        if ((num_sets & (num_sets - 1)) != 0) {
+            // Rare (e.g. prime-padded) geometries: generic, divide-based
+            hits = run_trace_impl<0, false>(addrs, n, tag_buf, age_buf, assoc,
+                                            num_sets, offset_bits, index_bits,
+                                            &tick);
+        } else {
+            switch (assoc) {
+                case 1:
+                    hits = run_trace_impl<1, true>(addrs, n, tag_buf, age_buf,
+                                                   assoc, num_sets, offset_bits,
+                                                   index_bits, &tick);
+                    break;
+                case 2:
+                    hits = run_trace_impl<2, true>(addrs, n, tag_buf, age_buf,
+                                                   assoc, num_sets, offset_bits,
+                                                   index_bits, &tick);
+                    break;
+                case 4:
+                    hits = run_trace_impl<4, true>(addrs, n, tag_buf, age_buf,
+                                                   assoc, num_sets, offset_bits,
+                                                   index_bits, &tick);
+                    break;
+                case 8:
+                    hits = run_trace_impl<8, true>(addrs, n, tag_buf, age_buf,
+                                                   assoc, num_sets, offset_bits,
+                                                   index_bits, &tick);
+                    break;
+                case 16:
+                    hits = run_trace_impl<16, true>(addrs, n, tag_buf, age_buf,
+                                                    assoc, num_sets, offset_bits,
+                                                    index_bits, &tick);
+                    break;
+                default:
+                    hits = run_trace_impl<0, true>(addrs, n, tag_buf, age_buf,
+                                                   assoc, num_sets, offset_bits,
+                                                   index_bits, &tick);
+                    break;
+            }
+        }
+    }
+
+    return {hits, tick};
+}
+
+}  // namespace
+
+PYBIND11_MODULE(_cache_sim_ext, m) {
+    m.doc() = "Native LRU trace replay for CacheSimulator";
+    // uint32 traces bind first (without conversion); anything else is
+    // converted to int64
+    m.def("run_trace", &run_trace<uint32_t, 0>,
+          "Replay a uint32 trace through SoA tag/age buffers in place; "
+          "returns (hits, tick)",
+          py::arg("trace").noconvert(), py::arg("tags").noconvert(),
+          py::arg("age").noconvert(), py::arg("tick"),
+          py::arg("offset_bits"), py::arg("index_bits"));
+    m.def("run_trace", &run_trace<int64_t, py::array::forcecast>,
+          "Replay an int64 trace through SoA tag/age buffers in place; "
+          "returns (hits, tick)",
+          py::arg("trace"), py::arg("tags").noconvert(),
+          py::arg("age").noconvert(), py::arg("tick"),
+          py::arg("offset_bits"), py::arg("index_bits"));
+}
@@ -13,15 +13,74 @@ This approach dramatically outperforms brute-force grid search by learning
 from previous evaluations and focusing on promising regions.
 """
 
+import itertools
+import multiprocessing
 import numpy as np
-from typing import List, Tuple, Dict, Callable
-from skopt import gp_minimize
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Dict, Callable, Optional, Set
+from sklearn.utils import check_random_state
+from skopt import Optimizer
+from skopt.sampler import Lhs
 from skopt.space import Integer
-from skopt.utils import use_named_args
+from skopt.utils import cook_estimator, create_result, normalize_dimensions
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# Objective functions of a worker process, installed once by _init_worker
+_worker_objective = None
+_worker_low_fidelity_objective = None
+
+
+def _init_worker(objective_function: Callable,
+                 low_fidelity_objective: Optional[Callable] = None):
+    """Install the objective functions in a worker process."""
+    global _worker_objective, _worker_low_fidelity_objective
+    _worker_objective = objective_function
+    _worker_low_fidelity_objective = low_fidelity_objective
+
+
+def _largest_prime_at_most(n: int) -> int:
+    """Largest prime <= n (n itself for n < 2)."""
+    for candidate in range(n, 1, -1):
+        if all(candidate % d for d in range(2, int(candidate ** 0.5) + 1)):
+            return candidate
+    return n
+
+
+def pareto_front_indices(sizes: np.ndarray, miss_rates: np.ndarray) -> np.ndarray:
+    """
+    Indices of the (cache size, miss rate) Pareto-optimal points.
+    
+    Kung's O(N log N) sweep: sort by cache size (ties by miss rate); a
+    point is Pareto-optimal if its miss rate beats every point of smaller
+    or equal size.
+    
+    Parameters:
+    -----------
+    sizes, miss_rates : np.ndarray
+        Cache size and miss rate of each point
+        
+    Returns:
+    --------
+    keep : np.ndarray
+        Indices of the Pareto-optimal points, in increasing cache size
+    """
+    order = np.lexsort((miss_rates, sizes))
+    sorted_miss = miss_rates[order]
+    best_before = np.minimum.accumulate(
+        np.concatenate(([np.inf], sorted_miss[:-1])))
+    return order[sorted_miss < best_before]
+
+
+def _evaluate_in_worker(config: Tuple[int, int, int],
+                        low_fidelity: bool = False) -> float:
+    """Evaluate one decoded configuration in a worker process."""
+    if low_fidelity:
+        return _worker_low_fidelity_objective(*config)
+    return _worker_objective(*config)
+
+
 class BayesianCacheOptimizer:
     """
     AI-driven cache configuration optimizer using Bayesian Optimization.
@@ -47,7 +106,8 @@ class BayesianCacheOptimizer:
                  min_cache_size: int = 1024,   # 1 KB min
                  n_calls: int = 50,
                  random_state: int = 42,
-                 verbose: bool = True):
+                 verbose: bool = True,
+                 prime_sets: bool = False):
         """
         Initialize the Bayesian optimizer.
         
@@ -63,18 +123,43 @@ class BayesianCacheOptimizer:
             Random seed for reproducibility
         verbose : bool
             Print optimization progress
+        prime_sets : bool
+            Pad every configuration's number of sets down to a prime
+            (shrinking the cache size accordingly), so the search never
+            visits power-of-two set counts whose address aliasing causes
+            pathological conflict misses on strided workloads
         """
         self.max_cache_size = max_cache_size
         self.min_cache_size = min_cache_size
         self.n_calls = n_calls
         self.random_state = random_state
         self.verbose = verbose
+        self.prime_sets = prime_sets
         
         # Optimization history
         self.history = []
         self.best_config = None
         self.best_miss_rate = float('inf')
         
+        # Miss rates of already simulated configurations. Distinct search
+        # points can decode to the same configuration (see _decode_params),
+        # so repeated configurations are answered without re-simulating.
+        # For full-fidelity evaluation this is the caller's known_results
+        # dict when one is given, extended in place.
+        self._eval_cache: Dict[Tuple[int, int, int], float] = {}
+        
+        # Configurations recorded in the history of the current fidelity
+        # phase; other cached configurations were simulated by the caller
+        self._visited: Set[Tuple[int, int, int]] = set()
+        
+        # GP observations (exponent-space points and objective values)
+        # carried over between optimize() calls for warm starts
+        self._prior_X: List[List[int]] = []
+        self._prior_y: List[float] = []
+        
+        # True while the search runs on the cheap low-fidelity objective
+        self._low_fidelity = False
+        
         # Define search space (design space knobs)
         # These are the parameters the AI will tune
         self._define_search_space()
@@ -98,14 +183,34 @@ class BayesianCacheOptimizer:
         Bayesian Optimization explores this intelligently.
         """
         # Cache size: 1KB to 64KB (powers of 2)
-        # Represented as exponent: 2^10 to 2^16
+        # Represented as exponent: 2^10 to 2^16, narrowed to the size
+        # constraints so the sampler never proposes sizes that decode to a
+        # clamped duplicate of the maximum (or fall below the minimum)
+        min_exp = max(10, (self.min_cache_size - 1).bit_length())
+        max_exp = min(16, (self.max_cache_size - 1).bit_length())
         self.space = [
-            Integer(10, 16, name='cache_size_exp'),  # 1KB to 64KB
+            Integer(min(min_exp, max_exp), max_exp,
+                    name='cache_size_exp'),  # 1KB to 64KB
             Integer(4, 9, name='block_size_exp'),     # 16B to 512B
             Integer(0, 4, name='assoc_exp')           # 1-way to 16-way (2^0 to 2^4)
         ]
         
         self.dimension_names = ['cache_size_exp', 'block_size_exp', 'assoc_exp']
+        
+        # The whole integer grid is small, so decode and validate every
+        # point once up front. Maps each valid exponent triple to its
+        # decoded configuration; points missing from it are invalid.
+        self._valid_configs: Dict[Tuple[int, int, int], Tuple[int, int, int]] = {}
+        for exps in itertools.product(*(range(dim.low, dim.high + 1)
+                                        for dim in self.space)):
+            config = self._decode_params(*exps)
+            if self._validate_config(*config):
+                if self.prime_sets:
+                    config = self._pad_to_prime_sets(*config)
+                    # Padding shrinks the cache, possibly below the minimum
+                    if config[0] < self.min_cache_size:
+                        continue
+                self._valid_configs[exps] = config
     
     def _decode_params(self, cache_size_exp: int, block_size_exp: int, 
                        assoc_exp: int) -> Tuple[int, int, int]:
@@ -147,6 +252,22 @@ class BayesianCacheOptimizer:
         
         return cache_size, block_size, associativity
     
+    def _pad_to_prime_sets(self, cache_size: int, block_size: int,
+                           associativity: int) -> Tuple[int, int, int]:
+        """
+        Reduce a valid configuration's set count to the largest prime.
+        
+        With a prime number of sets, strides that are multiples of a power
+        of two no longer map onto a few sets (the array-padding remedy for
+        conflict misses). The block size and associativity are kept, and
+        the cache size shrinks to block_size * associativity * sets, so
+        the padded configuration still meets the maximum size; it can fall
+        below the minimum size, which the caller must check.
+        """
+        num_sets = cache_size // (block_size * associativity)
+        num_sets = _largest_prime_at_most(num_sets)
+        return block_size * associativity * num_sets, block_size, associativity
+    
     def _validate_config(self, cache_size: int, block_size: int, 
                         associativity: int) -> bool:
         """
@@ -154,7 +275,7 @@ class BayesianCacheOptimizer:
         
         Design Constraints:
         1. Cache size must not exceed maximum (area/power budget)
-        2. Block size must divide cache size evenly
+        2. Block size (a power of two) must divide cache size evenly
         3. Associativity must be achievable with given cache geometry
         4. Must have at least one cache set
         
@@ -171,7 +292,8 @@ class BayesianCacheOptimizer:
         if cache_size > self.max_cache_size or cache_size < self.min_cache_size:
             return False
         
-        if block_size <= 0 or cache_size % block_size != 0:
+        # Sizes are powers of two, so divisibility is a mask test
+        if block_size <= 0 or (cache_size & (block_size - 1)) != 0:
             return False
         
         num_blocks = cache_size // block_size
@@ -184,24 +306,226 @@ class BayesianCacheOptimizer:
         
         return True
     
+    def _initial_design(self, n_samples: int) -> List[List[int]]:
+        """
+        Generate a space-filling initial design for the Gaussian Process.
+        
+        Random initial points frequently cluster on a small integer grid
+        and waste simulator calls. A maximin Latin Hypercube spreads the
+        samples over every dimension instead, so the GP starts from a
+        more informative set of observations.
+        
+        Parameters:
+        -----------
+        n_samples : int
+            Number of initial points to generate
+            
+        Returns:
+        --------
+        x0 : List[List[int]]
+            Distinct points in the exponent search space
+        """
+        lhs = Lhs(criterion="maximin", iterations=1000)
+        samples = lhs.generate(self.space, n_samples,
+                               random_state=self.random_state)
+        
+        # The integer space is tiny, so LHS can repeat a point
+        x0 = []
+        for point in samples:
+            point = [int(v) for v in point]
+            if point not in x0:
+                x0.append(point)
+        return x0
+    
+    def _prepare_point(self, point: List[int]) -> Tuple[Optional[Tuple[int, int, int]],
+                                                        Optional[float]]:
+        """
+        Decode and screen a search-space point before simulation.
+        
+        Parameters:
+        -----------
+        point : List[int]
+            Point in the exponent search space, ordered as self.space
+            
+        Returns:
+        --------
+        key : Tuple[int, int, int] or None
+            Decoded (cache_size, block_size, associativity), None if the
+            point is invalid
+        miss_rate : float or None
+            Known objective value (invalid or already evaluated
+            configuration), or None if the simulator must be run
+        """
+        # Decode and validate with a single table lookup
+        key = self._valid_configs.get(tuple(point))
+        if key is None:
+            # Return high penalty for invalid configurations
+            return None, 1.0
+        cache_size, block_size, associativity = key
+        
+        # Reuse the miss rate of an identical decoded configuration
+        cached = self._eval_cache.get(key)
+        if cached is not None and key not in self._visited:
+            # First visit of a configuration evaluated by the caller
+            self._record_evaluation(key, cached)
+        elif cached is not None:
+            self.history.append({
+                'cache_size': cache_size,
+                'block_size': block_size,
+                'associativity': associativity,
+                'miss_rate': cached,
+                'from_cache': True,
+                'fidelity': 'low' if self._low_fidelity else 'full'
+            })
+        return key, cached
+    
+    def _record_evaluation(self, key: Tuple[int, int, int], miss_rate: float):
+        """Record a simulated configuration in the cache, history and best."""
+        cache_size, block_size, associativity = key
+        self._eval_cache[key] = miss_rate
+        self._visited.add(key)
+        
+        config = {
+            'cache_size': cache_size,
+            'block_size': block_size,
+            'associativity': associativity,
+            'miss_rate': miss_rate,
+            'from_cache': False,
+            'fidelity': 'low' if self._low_fidelity else 'full'
+        }
+        self.history.append(config)
+        
+        # Update best found (low-fidelity miss rates only guide the search)
+        if not self._low_fidelity and miss_rate < self.best_miss_rate:
+            self.best_miss_rate = miss_rate
+            self.best_config = config.copy()
+            if self.verbose:
+                print(f"\n🎯 New best: Miss Rate = {miss_rate:.4f}")
+                print(f"   Config: Size={cache_size}B, Block={block_size}B, "
+                      f"Assoc={associativity}-way")
+    
+    def _evaluate_batch(self, points: List[List[int]],
+                        objective_function: Callable,
+                        executor: Optional[ProcessPoolExecutor]) -> List[float]:
+        """
+        Evaluate a batch of search-space points.
+        
+        Invalid and previously seen configurations are answered directly.
+        The remaining distinct configurations are simulated, in parallel
+        when an executor is given, or in a single evaluate_batch() call
+        when the objective provides one.
+        
+        Returns:
+        --------
+        miss_rates : List[float]
+            Objective value for each point, in order
+        """
+        keys = []
+        values = []
+        pending = []
+        for point in points:
+            key, miss_rate = self._prepare_point(point)
+            if miss_rate is None and key not in pending:
+                pending.append(key)
+            keys.append(key)
+            values.append(miss_rate)
+        
+        if executor is not None:
+            futures = [executor.submit(_evaluate_in_worker, key,
+                                       self._low_fidelity)
+                       for key in pending]
+        
+        batch_rates = None
+        evaluate_batch = getattr(objective_function, 'evaluate_batch', None)
+        if executor is None and evaluate_batch is not None and len(pending) > 1:
+            try:
+                batch_rates = list(evaluate_batch(pending))
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error evaluating batch: {e}")
+        
+        results = {}
+        for i, key in enumerate(pending):
+            # Evaluate objective (run cache simulator)
+            try:
+                if executor is not None:
+                    miss_rate = futures[i].result()
+                elif batch_rates is not None:
+                    miss_rate = float(batch_rates[i])
+                else:
+                    miss_rate = objective_function(*key)
+            except Exception as e:
+                if self.verbose:
+                    print(f"Error evaluating config: {e}")
+                results[key] = 1.0
+                continue
+            self._record_evaluation(key, miss_rate)
+            results[key] = miss_rate
+        
+        return [results[key] if value is None else value
+                for key, value in zip(keys, values)]
+    
+    def _make_optimizer(self, acq_func: str, rng) -> Optimizer:
+        """Build an ask/tell optimizer over the search space."""
+        # Same surrogate as gp_minimize: GP with a learned Gaussian noise term
+        base_estimator = cook_estimator(
+            "GP", space=normalize_dimensions(self.space),
+            random_state=rng.randint(0, np.iinfo(np.int32).max),
+            noise="gaussian"
+        )
+        return Optimizer(self.space, base_estimator,
+                         acq_func=acq_func,
+                         acq_optimizer="lbfgs",
+                         n_initial_points=0,
+                         random_state=rng)
+    
+    @staticmethod
+    def _best_points(opt: Optimizer, n_points: int) -> List[List[int]]:
+        """Return up to n_points distinct observed points, best first."""
+        points = []
+        for i in np.argsort(opt.yi, kind='stable'):
+            point = [int(v) for v in opt.Xi[i]]
+            if point not in points:
+                points.append(point)
+                if len(points) == n_points:
+                    break
+        return points
+    
     def optimize(self, objective_function: Callable, 
-                 acq_func: str = 'EI') -> Dict:
+                 acq_func: str = 'LCB',
+                 batch_size: int = 1,
+                 n_jobs: int = 1,
+                 warm_start: bool = True,
+                 low_fidelity_objective: Optional[Callable] = None,
+                 known_results: Optional[Dict[Tuple[int, int, int], float]] = None
+                 ) -> Dict:
         """
         Run Bayesian Optimization to find optimal cache configuration.
         
         Bayesian Optimization Algorithm:
         --------------------------------
-        1. Initialize: Sample a few random configurations (exploration)
+        1. Initialize: Sample a Latin Hypercube of configurations (exploration)
         2. Build Surrogate Model: Fit Gaussian Process to observed data
            - GP models objective function f(x) as a distribution
            - Provides mean prediction and uncertainty estimate
-        3. Acquisition Function: Use GP to decide next point to sample
-           - EI (Expected Improvement): E[max(f_best - f(x), 0)]
+        3. Acquisition Function: Use GP to decide next point(s) to sample
+           - LCB (Lower Confidence Bound): mu(x) - kappa * sigma(x)
            - Balances exploring uncertain regions vs. exploiting good regions
-        4. Evaluate: Run cache simulator at selected configuration
+           - kappa starts at 2.576 (99% bound) and halves every 10
+             evaluations, shifting from exploration to exploitation
+           - Batches of points use the constant-liar strategy: pending
+             points are imputed with the mean observed value
+        4. Evaluate: Run cache simulator at selected configuration(s)
         5. Update: Add result to dataset, update GP
         6. Repeat steps 2-5 until budget exhausted
         
+        With a low-fidelity objective, the first half of the budget only
+        needs to rank configurations approximately and runs on the cheap
+        objective with its own GP. The search then switches to a separate
+        full-fidelity GP, starting by re-evaluating the best low-fidelity
+        points on the full objective; low-fidelity miss rates are never
+        told to the full-fidelity GP or kept for warm starts.
+        
         Why this works:
         - GP learns correlations between parameters and performance
         - Discovers non-linear relationships (e.g., block size vs. miss rate)
@@ -212,70 +536,53 @@ class BayesianCacheOptimizer:
         -----------
         objective_function : Callable
             Function that takes (cache_size, block_size, associativity) 
-            and returns miss_rate
+            and returns miss_rate. Must be picklable when n_jobs > 1. It
+            may also provide an evaluate_batch(configs) method returning
+            one miss rate per (cache_size, block_size, associativity)
+            tuple, used to simulate whole batches (including the initial
+            design) in one call when n_jobs == 1.
         acq_func : str
-            Acquisition function: 'EI', 'LCB', or 'PI'
+            Acquisition function: 'LCB', 'EI', or 'PI'. LCB needs no
+            normal CDF/PDF evaluations, which makes optimizing the
+            acquisition function cheaper than with EI.
+        batch_size : int
+            Number of points proposed per surrogate fit
+        n_jobs : int
+            Worker processes used to simulate a batch in parallel
+        warm_start : bool
+            Seed the GP with the full-fidelity observations of the previous
+            optimize() call on this instance (e.g. a related workload)
+            instead of starting from a fresh initial design. The seeded
+            points are not part of the returned history or skopt_result.
+        low_fidelity_objective : Callable, optional
+            Cheaper approximation of objective_function (e.g. simulating
+            a subsampled trace) used for the first n_calls // 2
+            evaluations. Only full-fidelity results are reported as best.
+        known_results : dict, optional
+            Miss rates of configurations already simulated on the same
+            workload, {(cache_size, block_size, associativity): miss_rate}.
+            Full-fidelity probes of these configurations are answered
+            without running the simulator, and the dict is used as the
+            full-fidelity cache: new miss rates are added to it in place.
             
         Returns:
         --------
         result : dict
             Optimization results including best configuration and history
         """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        if n_jobs < 1:
+            raise ValueError(f"n_jobs must be at least 1, got {n_jobs}")
+        
         self.history = []
         self.best_config = None
         self.best_miss_rate = float('inf')
-        
-        # Wrapper to interface with skopt
-        @use_named_args(self.space)
-        def objective_wrapper(**params):
-            """
-            Wrapper function for the optimizer.
-            
-            This function:
-            1. Decodes parameters from search space
-            2. Validates configuration
-            3. Calls simulator (expensive operation)
-            4. Records result
-            5. Returns miss rate (to be minimized)
-            """
-            cache_size, block_size, associativity = self._decode_params(
-                params['cache_size_exp'],
-                params['block_size_exp'],
-                params['assoc_exp']
-            )
-            
-            # Validate configuration
-            if not self._validate_config(cache_size, block_size, associativity):
-                # Return high penalty for invalid configurations
-                return 1.0
-            
-            # Evaluate objective (run cache simulator)
-            try:
-                miss_rate = objective_function(cache_size, block_size, associativity)
-            except Exception as e:
-                if self.verbose:
-                    print(f"Error evaluating config: {e}")
-                return 1.0
-            
-            # Record in history
-            config = {
-                'cache_size': cache_size,
-                'block_size': block_size,
-                'associativity': associativity,
-                'miss_rate': miss_rate
-            }
-            self.history.append(config)
-            
-            # Update best found
-            if miss_rate < self.best_miss_rate:
-                self.best_miss_rate = miss_rate
-                self.best_config = config.copy()
-                if self.verbose:
-                    print(f"\n🎯 New best: Miss Rate = {miss_rate:.4f}")
-                    print(f"   Config: Size={cache_size}B, Block={block_size}B, "
-                          f"Assoc={associativity}-way")
-            
-            return miss_rate
+        self._low_fidelity = low_fidelity_objective is not None
+        n_low_fidelity = self.n_calls // 2 if self._low_fidelity else 0
+        full_cache = known_results if known_results is not None else {}
+        self._eval_cache = {} if self._low_fidelity else full_cache
+        self._visited = set()
         
         # Run Bayesian Optimization
         # The optimizer uses Gaussian Process regression as surrogate model
@@ -290,16 +597,92 @@ class BayesianCacheOptimizer:
             print(f"Acquisition Function: {acq_func}")
             print("="*70 + "\n")
         
-        # gp_minimize performs Gaussian Process-based Bayesian Optimization
-        result = gp_minimize(
-            func=objective_wrapper,
-            dimensions=self.space,
-            n_calls=self.n_calls,
-            random_state=self.random_state,
-            acq_func=acq_func,  # Expected Improvement
-            n_initial_points=10,  # Random exploration first
-            verbose=self.verbose
-        )
+        rng = check_random_state(self.random_state)
+        opt = self._make_optimizer(acq_func, rng)
+        # The low-fidelity phase gets its own surrogate, so its miss rates
+        # never reach the full-fidelity GP
+        low_opt = self._make_optimizer(acq_func, rng) if self._low_fidelity else None
+        
+        # The objective is sent once per worker instead of once per task,
+        # so a large trace bound into it is not re-pickled every call
+        executor = None
+        if n_jobs > 1:
+            # Spawned rather than forked, which is unsafe once this
+            # process has started Numba's parallel worker threads
+            executor = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(objective_function, low_fidelity_objective))
+        
+        try:
+            points = None
+            if warm_start and self._prior_X:
+                # Start the GP from earlier runs instead of an initial design
+                if acq_func == 'LCB':
+                    opt.acq_func_kwargs = {"kappa": 2.576}
+                opt.tell(self._prior_X, self._prior_y)
+            if self._low_fidelity or not (warm_start and self._prior_X):
+                # Space-filling initial design instead of random exploration
+                points = self._initial_design(min(10, self.n_calls))
+            
+            # Full-fidelity observations made by this call (excluding the
+            # warm-start priors told above)
+            full_X: List[List[int]] = []
+            full_y: List[float] = []
+            n_evaluated = 0
+            while n_evaluated < self.n_calls:
+                if self._low_fidelity and n_evaluated >= n_low_fidelity:
+                    # Switch to the full objective; low-fidelity miss rates
+                    # must not answer full-fidelity lookups
+                    self._low_fidelity = False
+                    self._eval_cache = full_cache
+                    self._visited = set()
+                    if points is None:
+                        points = self._best_points(
+                            low_opt, min(5, self.n_calls - n_evaluated))
+                    if self.verbose:
+                        print("\nSwitching to full-fidelity evaluation")
+                active = low_opt if self._low_fidelity else opt
+                
+                if points is None:
+                    n_points = min(batch_size, self.n_calls - n_evaluated)
+                    if n_points == 1:
+                        points = [active.ask()]
+                    else:
+                        points = active.ask(n_points=n_points, strategy="cl_mean")
+                    points = [[int(v) for v in point] for point in points]
+                
+                miss_rates = self._evaluate_batch(
+                    points,
+                    low_fidelity_objective if self._low_fidelity
+                    else objective_function,
+                    executor)
+                n_evaluated += len(points)
+                
+                # Anneal kappa before tell(), which optimizes the
+                # acquisition function for the next ask()
+                if acq_func == 'LCB':
+                    kappa = 2.576 * 0.5 ** (n_evaluated // 10)
+                    active.acq_func_kwargs = {"kappa": kappa}
+                active.tell(points, miss_rates)
+                if active is opt:
+                    full_X.extend(points)
+                    full_y.extend(miss_rates)
+                points = None
+        finally:
+            self._low_fidelity = False
+            if executor is not None:
+                executor.shutdown()
+        
+        # Report only this call's evaluations, not the warm-start priors
+        result = create_result(full_X, full_y, opt.space, opt.rng,
+                               models=opt.models)
+        
+        # Keep this call's full-fidelity observations for warm-starting the
+        # next optimize() call
+        self._prior_X = full_X
+        self._prior_y = full_y
         
         if self.verbose:
             print("\n" + "="*70)
@@ -338,24 +721,17 @@ class BayesianCacheOptimizer:
         pareto_points : List[Dict]
             List of Pareto-optimal configurations sorted by cache size
         """
-        if not self.history:
+        # Cached re-evaluations duplicate an earlier entry, and
+        # low-fidelity miss rates are not comparable to full ones
+        candidates = [config for config in self.history
+                      if not config.get('from_cache')
+                      and config.get('fidelity') != 'low']
+        if not candidates:
             return []
         
-        pareto_points = []
-        
-        # Sort by cache size for efficient Pareto extraction
-        sorted_history = sorted(self.history, key=lambda x: x['cache_size'])
-        
-        min_miss_rate_so_far = float('inf')
-        
-        for config in sorted_history:
-            # A point is Pareto-optimal if it has the best miss rate
-            # seen so far for its cache size or smaller
-            if config['miss_rate'] < min_miss_rate_so_far:
-                pareto_points.append(config)
-                min_miss_rate_so_far = config['miss_rate']
-        
-        return pareto_points
+        sizes = np.array([c['cache_size'] for c in candidates])
+        miss_rates = np.array([c['miss_rate'] for c in candidates])
+        return [candidates[i] for i in pareto_front_indices(sizes, miss_rates)]
 
 
 if __name__ == "__main__":
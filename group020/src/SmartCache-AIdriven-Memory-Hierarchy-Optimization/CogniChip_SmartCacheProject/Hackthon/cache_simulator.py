@@ -10,9 +10,20 @@ Key Features:
 - Miss rate calculation as primary performance metric
 """
 
-import math
-from typing import List, Tuple, Dict
+import os
+import threading
 from collections import OrderedDict
+from typing import List, Tuple, Dict, Union
+import numpy as np
+from cache_simulator_numba import (NUMBA_AVAILABLE, as_trace_array,
+                                   get_trace_kernel, replay_until_steady)
+
+# Optional native replay extension (python setup.py build_ext --inplace),
+# used for ndarray traces when CACHE_SIM_NATIVE=1
+try:
+    import _cache_sim_ext
+except ImportError:
+    _cache_sim_ext = None
 
 
 class CacheSimulator:
@@ -53,13 +64,25 @@ class CacheSimulator:
         self.num_blocks = cache_size // block_size
         self.num_sets = self.num_blocks // associativity
         
-        # Address bit fields
-        self.offset_bits = int(math.log2(block_size))
-        self.index_bits = int(math.log2(self.num_sets))
+        # Address bit fields (integer floor(log2), no float round-trip)
+        self.offset_bits = block_size.bit_length() - 1
+        self.index_bits = self.num_sets.bit_length() - 1
+        
+        # Precomputed field extraction for the access() hot path
+        self._index_mask = (1 << self.index_bits) - 1
+        self._tag_shift = self.offset_bits + self.index_bits
+        
+        # Set counts that are not a power of two (e.g. padded to a prime
+        # to avoid conflict misses) index by block address modulo num_sets
+        self._pow2_sets = (self.num_sets & (self.num_sets - 1)) == 0
         
-        # Initialize cache structure: list of sets, each set is an OrderedDict for LRU
-        # OrderedDict maintains insertion order, we'll move accessed items to end
-        self.cache = [OrderedDict() for _ in range(self.num_sets)]
+        # Initialize cache structure as two contiguous arrays (SoA layout):
+        # _tags[set, way] holds the stored tag (-1 = invalid way) and
+        # _age[set, way] holds the tick of the last access for LRU.
+        # The way with the smallest age in a set is the LRU victim.
+        self._tags = np.full((self.num_sets, self.associativity), -1, np.int64)
+        self._age = np.zeros_like(self._tags, dtype=np.int32)
+        self._tick = 0
         
         # Performance counters
         self.hits = 0
@@ -70,6 +93,9 @@ class CacheSimulator:
         """
         Parse memory address into tag, index, and offset.
         
+        Debugging/inspection helper: access() extracts tag and index
+        inline since the offset never takes part in cache lookups.
+        
         Returns:
         --------
         tag : int
@@ -80,6 +106,9 @@ class CacheSimulator:
             Block offset (not used in cache logic but included for completeness)
         """
         offset = address & ((1 << self.offset_bits) - 1)
+        if not self._pow2_sets:
+            block = address >> self.offset_bits
+            return block // self.num_sets, block % self.num_sets, offset
         index = (address >> self.offset_bits) & ((1 << self.index_bits) - 1)
         tag = address >> (self.offset_bits + self.index_bits)
         return tag, index, offset
@@ -99,44 +128,77 @@ class CacheSimulator:
             True if cache hit, False if cache miss
         """
         self.total_accesses += 1
-        tag, index, offset = self._parse_address(address)
+        if self._pow2_sets:
+            index = (address >> self.offset_bits) & self._index_mask
+            tag = address >> self._tag_shift
+        else:
+            tag, index = divmod(address >> self.offset_bits, self.num_sets)
         
-        cache_set = self.cache[index]
+        # Tick starts at 1 so a touched way is always younger than an
+        # invalid way (age 0)
+        self._tick += 1
+        row = self._tags[index]
+        hit_mask = row == tag
         
         # Check for cache hit
-        if tag in cache_set:
+        if hit_mask.any():
             self.hits += 1
-            # LRU: Move accessed block to end (most recently used)
-            cache_set.move_to_end(tag)
+            # LRU: Mark accessed block as most recently used
+            self._age[index, hit_mask] = self._tick
             return True
         
         # Cache miss
         self.misses += 1
         
-        # Check if set is full
-        if len(cache_set) >= self.associativity:
-            # Evict LRU block (first item in OrderedDict)
-            cache_set.popitem(last=False)
+        # Evict LRU block (invalid ways have age 0 and are filled first)
+        victim = np.argmin(self._age[index])
         
-        # Insert new block (at end = most recently used)
-        cache_set[tag] = True
+        # Insert new block as most recently used
+        row[victim] = tag
+        self._age[index, victim] = self._tick
         
         return False
     
-    def run_trace(self, trace: List[int]) -> Dict[str, float]:
+    def run_trace(self, trace: Union[List[int], np.ndarray]) -> Dict[str, float]:
         """
         Run a complete memory access trace through the simulator.
         
+        NumPy int64 or uint32 arrays are the fast path: they are replayed by
+        the compiled kernel (or the native extension when built and
+        CACHE_SIM_NATIVE=1) instead of calling access() once per address
+        (an np.memmap works too, for traces that should not be fully
+        resident). Python lists take the legacy per-access loop and are
+        kept for compatibility.
+        
         Parameters:
         -----------
-        trace : List[int]
-            List of memory addresses to access
+        trace : List[int] or np.ndarray
+            Memory addresses to access
             
         Returns:
         --------
         results : dict
             Performance metrics including miss rate
         """
+        if isinstance(trace, np.ndarray):
+            use_native = (_cache_sim_ext is not None and
+                          os.environ.get('CACHE_SIM_NATIVE') == '1')
+            if use_native or NUMBA_AVAILABLE:
+                trace = as_trace_array(trace)
+                kernel = (_cache_sim_ext.run_trace if use_native
+                          else get_trace_kernel(self.associativity,
+                                                self.num_sets))
+                hits, self._tick = kernel(
+                    trace, self._tags, self._age, self._tick,
+                    self.offset_bits, self.index_bits
+                )
+                self.hits += hits
+                self.misses += trace.size - hits
+                self.total_accesses += trace.size
+                return self.get_statistics()
+            # Python ints are much cheaper to operate on than NumPy scalars
+            trace = trace.tolist()
+        
         for address in trace:
             self.access(address)
         
@@ -177,8 +239,16 @@ class CacheSimulator:
         }
     
     def reset(self):
-        """Reset cache state and performance counters."""
-        self.cache = [OrderedDict() for _ in range(self.num_sets)]
+        """
+        Reset cache state and performance counters.
+        
+        The tag/age buffers are cleared in place; cache geometry is fixed
+        after __init__, so a simulator can be reused across traces without
+        reallocating.
+        """
+        self._tags.fill(-1)
+        self._age.fill(0)
+        self._tick = 0
         self.hits = 0
         self.misses = 0
         self.total_accesses = 0
@@ -213,12 +283,49 @@ class CacheSimulator:
                 f"  Number of Blocks: {config['num_blocks']}")
 
 
+# Reusable simulators, one pool per thread so concurrent evaluations
+# (e.g. the baseline thread pool) never share a simulator's state
+_sim_pool = threading.local()
+_SIM_POOL_SIZE = 64
+
+
+def _get_sim(cache_size: int, block_size: int,
+             associativity: int) -> CacheSimulator:
+    """
+    Return this thread's simulator for a configuration, reset for a new trace.
+    
+    Optimization runs revisit the same configurations many times; reusing
+    a simulator (reset in place) avoids reallocating its tag/age buffers
+    on every evaluation. Each thread keeps its own least recently used
+    pool of at most _SIM_POOL_SIZE simulators.
+    """
+    sims = getattr(_sim_pool, 'sims', None)
+    if sims is None:
+        sims = _sim_pool.sims = OrderedDict()
+    key = (cache_size, block_size, associativity)
+    simulator = sims.get(key)
+    if simulator is None:
+        simulator = CacheSimulator(cache_size, block_size, associativity)
+        sims[key] = simulator
+        if len(sims) > _SIM_POOL_SIZE:
+            sims.popitem(last=False)
+    else:
+        sims.move_to_end(key)
+        simulator.reset()
+    return simulator
+
+
 def evaluate_cache_config(cache_size: int, block_size: int, 
-                         associativity: int, trace: List[int]) -> float:
+                         associativity: int,
+                         trace: Union[List[int], np.ndarray],
+                         early_stop_tol: float = None) -> float:
     """
     Convenience function to evaluate a cache configuration on a trace.
     
     This function provides a simple interface for the optimization agent.
+    Callers evaluating many configurations (such as the optimizer's
+    objective) should pass an int64 or uint32 ndarray so the trace is
+    converted once and always takes the compiled fast path.
     
     Parameters:
     -----------
@@ -228,18 +335,32 @@ def evaluate_cache_config(cache_size: int, block_size: int,
         Block size in bytes
     associativity : int
         Set associativity
-    trace : List[int]
+    trace : List[int] or np.ndarray
         Memory access trace
+    early_stop_tol : float, optional
+        Stop simulating once the windowed miss rate has converged to
+        within this tolerance (steady state) and report the miss rate so
+        far. None (default) replays the whole trace.
         
     Returns:
     --------
     miss_rate : float
         Miss rate for this configuration [0.0, 1.0]
     """
+    trace = as_trace_array(trace)
     try:
-        simulator = CacheSimulator(cache_size, block_size, associativity)
-        results = simulator.run_trace(trace)
-        return results['miss_rate']
+        simulator = _get_sim(cache_size, block_size, associativity)
+        if early_stop_tol is None:
+            results = simulator.run_trace(trace)
+            return results['miss_rate']
+        
+        def replay(chunk):
+            misses = simulator.misses
+            simulator.run_trace(chunk)
+            return simulator.misses - misses
+        
+        misses, simulated = replay_until_steady(replay, trace, early_stop_tol)
+        return misses / simulated if simulated else 0.0
     except (AssertionError, ValueError) as e:
         # Invalid configuration, return worst possible miss rate
         return 1.0
@@ -252,7 +373,7 @@ if __name__ == "__main__":
     print("="*60)
     
     # Create a simple test trace (sequential access pattern)
-    test_trace = [i * 64 for i in range(1000)]  # 64-byte stride
+    test_trace = np.arange(0, 1000 * 64, 64, dtype=np.int64)  # 64-byte stride
     
     # Test configuration
     cache = CacheSimulator(cache_size=4096, block_size=64, associativity=4)
@@ -0,0 +1,411 @@
+"""
+SmartCache Simulator Kernels - JIT-Compiled Trace Replay
+=========================================================
+Compiled inner loops for CacheSimulator operating on NumPy int64 (or
+uint32) traces and on the simulator's SoA tag/age arrays. The kernels release the GIL,
+so independent simulations can run in parallel threads.
+
+Numba is optional: without it the kernels still run as plain Python
+functions, and CacheSimulator falls back to its interpreted access path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    from numba.extending import register_jitable
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Identity decorator used when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    register_jitable = njit
+
+
+# Trace element types the kernels are specialized for. Generated traces
+# are uint32 (all addresses fit in 32 bits), which halves the bytes
+# streamed per access; any other input is converted to int64.
+TRACE_DTYPES = (np.dtype(np.uint32), np.dtype(np.int64))
+
+
+def as_trace_array(trace):
+    """
+    Return trace as a contiguous array in one of TRACE_DTYPES.
+
+    uint32 and int64 arrays are passed through without a copy (so 32-bit
+    traces are never silently widened); lists and other dtypes become
+    int64.
+    """
+    trace = np.asarray(trace)
+    if trace.dtype in TRACE_DTYPES:
+        return np.ascontiguousarray(trace)
+    return trace.astype(np.int64)
+
+
+# Set-indexing functions plugged into _make_kernel. They are registered
+# as plain functions rather than dispatchers so that kernels closing over
+# them can still be cached on disk (Numba cannot key its cache on a
+# dispatcher held in a closure).
+@register_jitable(inline='always')
+def _pow2_set_index(address, offset_bits, index_bits, num_sets):
+    """Set index and tag as bit fields of the address."""
+    block = address >> offset_bits
+    return block & ((1 << index_bits) - 1), block >> index_bits
+
+
+@register_jitable(inline='always')
+def _mod_set_index(address, offset_bits, index_bits, num_sets):
+    """Set index and tag as remainder and quotient of the block address."""
+    block = address >> offset_bits
+    return block % num_sets, block // num_sets
+
+
+@njit(inline='always')
+def _access_set(tags, age, index, tag, tick, associativity):
+    """
+    Look up tag in one set and update it as an LRU access.
+
+    Returns True on a hit. The matching way is refreshed on a hit; on a
+    miss the LRU way (invalid ways have age 0 and are filled first) is
+    replaced.
+    """
+    # Branchless way search: scan every way and select with conditional
+    # moves instead of breaking out on a match, since hit/miss outcomes
+    # are too irregular to predict
+    found = -1
+    victim = 0
+    min_age = age[index, 0]
+    for way in range(associativity):
+        found = way if tags[index, way] == tag else found
+    for way in range(1, associativity):
+        better = age[index, way] < min_age
+        victim = way if better else victim
+        min_age = age[index, way] if better else min_age
+
+    is_hit = found >= 0
+    slot = found if is_hit else victim
+    tags[index, slot] = tag
+    age[index, slot] = tick
+    return is_hit
+
+
+def _make_kernel(set_index, associativity=0):
+    """
+    Build a replay kernel from a set-indexing function.
+
+    set_index(address, offset_bits, index_bits, num_sets) returns the
+    (set index, tag) of an address; it and _access_set are inlined into
+    the loop. A positive associativity is a closure constant, so Numba
+    compiles it as a literal and fully unrolls (and can vectorize) the
+    per-set way scans; 0 takes the way count from tags.shape[1]. Address
+    shifts stay runtime arguments: specializing on them too would compile
+    a kernel per cache geometry, which costs more than it saves during
+    design-space exploration.
+    """
+    @njit(nogil=True, cache=True)
+    def kernel(trace, tags, age, tick, offset_bits, index_bits):
+        """
+        Replay a trace through an LRU cache held in SoA arrays.
+
+        Parameters:
+        -----------
+        trace : np.ndarray (int64 or uint32)
+            Memory addresses to access
+        tags : np.ndarray (int64, num_sets x associativity)
+            Stored tags, -1 marks an invalid way (updated in place)
+        age : np.ndarray (int32, num_sets x associativity)
+            Tick of the last access per way (updated in place)
+        tick : int
+            Current LRU tick
+        offset_bits, index_bits : int
+            Address bit-field widths
+
+        Returns:
+        --------
+        hits : int
+            Number of hits in this trace
+        tick : int
+            LRU tick after the last access
+        """
+        num_sets = tags.shape[0]
+        ways = associativity if associativity > 0 else tags.shape[1]
+        # Integer hit count only; callers derive the miss rate once at the end
+        hits = 0
+
+        for i in range(trace.size):
+            index, tag = set_index(trace[i], offset_bits, index_bits,
+                                   num_sets)
+            tick += 1
+            hits += _access_set(tags, age, index, tag, tick, ways)
+
+        return hits, tick
+
+    return kernel
+
+
+# Generic kernel for any associativity and a power-of-two number of sets
+run_trace_kernel = _make_kernel(_pow2_set_index)
+
+# Kernel for a number of sets that is not a power of two: the set index
+# is the block address modulo the number of sets (taken from
+# tags.shape[0]) and the tag the quotient, so every set is used;
+# index_bits is ignored
+run_trace_kernel_mod = _make_kernel(_mod_set_index)
+
+
+@njit(nogil=True, cache=True)
+def run_trace_kernel_dm(trace, tags, age, tick, offset_bits, index_bits):
+    """
+    run_trace_kernel for a direct-mapped cache (associativity 1).
+
+    With a single way there is no victim to choose, so each access is one
+    tag compare and an unconditional store; the LRU ages are never read
+    and are left untouched. Same arguments and return values as
+    run_trace_kernel.
+    """
+    index_mask = (1 << index_bits) - 1
+    tag_shift = offset_bits + index_bits
+    hits = 0
+
+    for i in range(trace.size):
+        address = trace[i]
+        index = (address >> offset_bits) & index_mask
+        tag = address >> tag_shift
+        hits += tags[index, 0] == tag
+        tags[index, 0] = tag
+
+    return hits, tick + trace.size
+
+
+# Specialized kernels for the associativities explored by the optimizer
+_KERNELS = {assoc: _make_kernel(_pow2_set_index, assoc)
+            for assoc in (2, 4, 8, 16)}
+_KERNELS[1] = run_trace_kernel_dm
+
+
+def get_trace_kernel(associativity, num_sets=1):
+    """
+    Select the replay kernel for a given cache geometry.
+
+    Returns a kernel with the same signature as run_trace_kernel; uncommon
+    associativities use the generic kernel, and set counts that are not a
+    power of two (e.g. prime-padded) the modulo-indexed kernel.
+    """
+    if num_sets & (num_sets - 1):
+        return run_trace_kernel_mod
+    return _KERNELS.get(associativity, run_trace_kernel)
+
+
+# Steady-state early stopping: miss rates are compared window by window
+STEADY_STATE_WINDOW = 4096
+STEADY_STATE_PATIENCE = 3
+
+
+def replay_until_steady(replay, trace, early_stop_tol, warmup=None):
+    """
+    Replay a trace window by window until its miss rate stops changing.
+
+    After a warm-up prefix, replay stops once the miss rate of
+    STEADY_STATE_PATIENCE consecutive windows of STEADY_STATE_WINDOW
+    accesses each differs from the previous window's by less than
+    early_stop_tol; the miss rate so far then stands for the whole trace.
+
+    Parameters:
+    -----------
+    replay : Callable
+        replay(chunk) simulates a slice of the trace on persistent cache
+        state and returns the number of misses in it
+    trace : np.ndarray or List[int]
+        Memory access trace
+    early_stop_tol : float
+        Convergence tolerance on the per-window miss rate
+    warmup : int, optional
+        Accesses always simulated before stopping is allowed (default:
+        10% of the trace); rounded up to a whole window
+
+    Returns:
+    --------
+    misses : int
+        Misses among the simulated accesses
+    simulated : int
+        Number of accesses simulated
+    """
+    n = len(trace)
+    window = STEADY_STATE_WINDOW
+    if warmup is None:
+        warmup = n // 10
+    warmup = -(-warmup // window) * window
+
+    # Convergence is tested on integer miss counts per window; the
+    # tolerance is scaled to a miss count once instead of dividing every
+    # window (only the final, partial window can differ in size)
+    max_delta = early_stop_tol * window
+    misses = 0
+    stable = 0
+    previous_misses = None
+    for start in range(0, n, window):
+        chunk = trace[start:start + window]
+        chunk_misses = replay(chunk)
+        misses += chunk_misses
+        end = start + len(chunk)
+
+        if (previous_misses is not None
+                and abs(chunk_misses - previous_misses) < max_delta):
+            stable += 1
+        else:
+            stable = 0
+        previous_misses = chunk_misses
+        if stable >= STEADY_STATE_PATIENCE and end >= warmup:
+            return misses, end
+    return misses, n
+
+
+def eval_miss_rate(trace, cache_size, block_size, associativity,
+                   early_stop_tol=None):
+    """
+    Miss rate of a cold LRU cache on a trace, without a CacheSimulator.
+
+    Drop-in replacement for cache_simulator.evaluate_cache_config on
+    int64 or uint32 traces: allocates fresh tag/age arrays and runs the specialized
+    kernel directly, skipping the simulator object and its statistics.
+
+    Parameters:
+    -----------
+    trace : np.ndarray (int64 or uint32)
+        Memory access trace
+    cache_size, block_size, associativity : int
+        Cache configuration
+    early_stop_tol : float, optional
+        Stop once the miss rate reaches a steady state (see
+        replay_until_steady); None replays the whole trace
+
+    Returns:
+    --------
+    miss_rate : float
+        Miss rate in [0.0, 1.0]; 1.0 for an invalid configuration
+    """
+    # Same validity rules as CacheSimulator.__init__
+    if (cache_size <= 0 or associativity <= 0 or block_size <= 0
+            or block_size & (block_size - 1)
+            or cache_size < block_size * associativity):
+        return 1.0
+
+    trace = as_trace_array(trace)
+    if trace.size == 0:
+        return 0.0
+
+    num_sets = cache_size // block_size // associativity
+    tags = np.full((num_sets, associativity), -1, np.int64)
+    age = np.zeros((num_sets, associativity), np.int32)
+    kernel = get_trace_kernel(associativity, num_sets)
+    offset_bits = block_size.bit_length() - 1
+    index_bits = num_sets.bit_length() - 1
+
+    if early_stop_tol is None:
+        hits, _ = kernel(trace, tags, age, 0, offset_bits, index_bits)
+        return (trace.size - hits) / trace.size
+
+    tick = 0
+
+    def replay(chunk):
+        nonlocal tick
+        hits, tick = kernel(chunk, tags, age, tick, offset_bits, index_bits)
+        return chunk.size - hits
+
+    misses, simulated = replay_until_steady(replay, trace, early_stop_tol)
+    return misses / simulated
+
+
+def warm_up():
+    """
+    Compile (or load from Numba's on-disk cache) every specialized kernel.
+
+    Call once per process before timing-sensitive work so the first
+    evaluations do not pay the JIT compilation cost. Read-only traces
+    (as returned by TraceGenerator) compile separately and are covered too.
+    """
+    for dtype in TRACE_DTYPES:
+        for writeable in (True, False):
+            trace = np.zeros(1, dtype=dtype)
+            trace.flags.writeable = writeable
+            for associativity in _KERNELS:
+                eval_miss_rate(trace, 64 * associativity, 64, associativity)
+
+
+@njit(nogil=True, cache=True)
+def _floor_log2(value):
+    """Integer floor(log2(value)) for value >= 1 (int.bit_length() - 1)."""
+    bits = 0
+    while value > 1:
+        value >>= 1
+        bits += 1
+    return bits
+
+
+@njit(nogil=True, cache=True)
+def _eval_single(trace, cache_size, block_size, associativity):
+    """Compiled eval_miss_rate on the generic kernel, for batch evaluation."""
+    if (cache_size <= 0 or associativity <= 0 or block_size <= 0
+            or (block_size & (block_size - 1)) != 0
+            or cache_size < block_size * associativity):
+        return 1.0
+    if trace.size == 0:
+        return 0.0
+
+    num_sets = cache_size // block_size // associativity
+    tags = np.full((num_sets, associativity), -1, np.int64)
+    age = np.zeros((num_sets, associativity), np.int32)
+    if num_sets & (num_sets - 1):
+        hits, _ = run_trace_kernel_mod(trace, tags, age, 0,
+                                       _floor_log2(block_size), 0)
+    elif associativity == 1:
+        hits, _ = run_trace_kernel_dm(trace, tags, age, 0,
+                                      _floor_log2(block_size),
+                                      _floor_log2(num_sets))
+    else:
+        hits, _ = run_trace_kernel(trace, tags, age, 0,
+                                   _floor_log2(block_size),
+                                   _floor_log2(num_sets))
+    return (trace.size - hits) / trace.size
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _eval_batch_kernel(cache_sizes, block_sizes, associativities, trace):
+    out = np.empty(cache_sizes.size, dtype=np.float64)
+    for k in prange(cache_sizes.size):
+        out[k] = _eval_single(trace, cache_sizes[k], block_sizes[k],
+                              associativities[k])
+    return out
+
+
+def evaluate_cache_configs_batch(cache_sizes, block_sizes, associativities,
+                                 trace):
+    """
+    Miss rates of several cache configurations on the same trace.
+
+    The configurations are simulated in parallel threads (Numba prange)
+    within one call, all reading the same trace array, instead of one
+    Python-level call per configuration.
+
+    Parameters:
+    -----------
+    cache_sizes, block_sizes, associativities : array-like of int
+        One entry per configuration
+    trace : np.ndarray (int64 or uint32)
+        Memory access trace
+
+    Returns:
+    --------
+    miss_rates : np.ndarray (float64)
+        Miss rate per configuration; 1.0 for invalid configurations
+    """
+    return _eval_batch_kernel(np.asarray(cache_sizes, dtype=np.int64),
+                              np.asarray(block_sizes, dtype=np.int64),
+                              np.asarray(associativities, dtype=np.int64),
+                              as_trace_array(trace))
@@ -11,14 +11,264 @@ Key Components:
 4. Pareto frontier visualization
 """
 
+import os
+import sys
 import time
 import json
+from concurrent.futures import (ProcessPoolExecutor, ThreadPoolExecutor,
+                                as_completed)
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
 from typing import Dict, List, Tuple
 import numpy as np
 from cache_simulator import CacheSimulator, evaluate_cache_config
+from cache_simulator_numba import (NUMBA_AVAILABLE, as_trace_array,
+                                   eval_miss_rate,
+                                   evaluate_cache_configs_batch, warm_up)
 from trace_generator import TraceGenerator
 from ai_optimizer import BayesianCacheOptimizer
 
+# Optional fast JSON serializer for save_results (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Worker processes are spawned, not forked: a parent that has run a
+# parallel Numba kernel (e.g. generating a matmul trace) owns TBB worker
+# threads, and forking it leaves the parent hanging at exit
+_SPAWN = multiprocessing.get_context('spawn')
+
+
+# With Numba, evaluate configurations with the compiled kernels directly
+# instead of going through a CacheSimulator per evaluation (the native
+# extension, when requested, is only reachable through the simulator)
+_USE_KERNELS = NUMBA_AVAILABLE and os.environ.get('CACHE_SIM_NATIVE') != '1'
+
+
+# Traces by key for the evaluation memo. Entries hold a reference to the
+# trace, so an id()-based key stays unique while it is registered; owners
+# drop their entries with _unregister_trace() once the trace is done with.
+_trace_registry: Dict[int, np.ndarray] = {}
+
+# The evaluation memo: miss rates of simulated configurations per
+# registered trace, _miss_rates[trace_key][(cache_size, block_size,
+# associativity)]. Baseline evaluation, the objectives and the optimizer
+# (as its known results) all read and extend the same dict for a trace.
+_miss_rates: Dict[int, Dict[Tuple[int, int, int], float]] = {}
+
+
+def _register_trace(trace, trace_key: int = None) -> int:
+    """
+    Register a trace for memoized evaluation and return its key.
+    
+    Worker processes pass the key assigned by the parent process so that
+    repeated evaluations of the same workload share memo entries.
+    """
+    if trace_key is None:
+        trace_key = id(trace)
+    _trace_registry.setdefault(trace_key, trace)
+    _miss_rates.setdefault(trace_key, {})
+    return trace_key
+
+
+# Shared memory segments attached by this (worker) process; they must stay
+# open for as long as the registered trace views are in use
+_attached_shms: Dict[str, SharedMemory] = {}
+
+
+def _attach_trace(trace_key: int, shm_name: str,
+                  shape: Tuple[int, ...], dtype: str) -> np.ndarray:
+    """
+    Get a trace shared by the parent process as a zero-copy array view.
+    
+    Parameters:
+    -----------
+    trace_key : int
+        Memo key assigned by the parent process
+    shm_name : str
+        Name of the shared memory segment holding the trace
+    shape : tuple
+        Shape of the trace array
+    dtype : str
+        NumPy dtype string of the trace array (uint32 or int64)
+        
+    Returns:
+    --------
+    trace : np.ndarray
+        Registered trace (inherited from the parent under fork, otherwise
+        a view of the shared segment)
+    """
+    if trace_key not in _trace_registry:
+        shm = _attached_shms.get(shm_name)
+        if shm is None:
+            shm = _attached_shms[shm_name] = SharedMemory(name=shm_name)
+        _register_trace(np.ndarray(shape, dtype=dtype, buffer=shm.buf),
+                        trace_key)
+    return _trace_registry[trace_key]
+
+
+def _cached_eval(cache_size: int, block_size: int, associativity: int,
+                 trace_key: int) -> float:
+    """Memoized evaluate_cache_config on a registered trace."""
+    memo = _miss_rates[trace_key]
+    key = (cache_size, block_size, associativity)
+    miss_rate = memo.get(key)
+    if miss_rate is None:
+        trace = _trace_registry[trace_key]
+        if _USE_KERNELS:
+            miss_rate = eval_miss_rate(trace, *key)
+        else:
+            miss_rate = evaluate_cache_config(*key, trace)
+        memo[key] = miss_rate
+    return miss_rate
+
+
+def _unregister_trace(*trace_keys: int):
+    """
+    Release registered traces along with their memoized miss rates.
+    
+    Once a trace is released its id() may be reused by a new trace, so
+    the memo cannot keep entries under the old key.
+    """
+    for key in trace_keys:
+        _trace_registry.pop(key, None)
+        _miss_rates.pop(key, None)
+
+
+def _subsample_trace(trace: np.ndarray, warmup_fraction: float = 0.1,
+                     keep_every: int = 4, chunk_size: int = 4096) -> np.ndarray:
+    """
+    Build a cheap low-fidelity version of a trace for early BO probes.
+    
+    The first warmup_fraction of accesses (dominated by cold misses) is
+    dropped, and the remainder is subsampled deterministically by keeping
+    one chunk of consecutive accesses out of every keep_every. Whole
+    chunks are kept rather than every n-th access, which would destroy
+    the spatial locality that block size and associativity are tuned for.
+    
+    Parameters:
+    -----------
+    trace : np.ndarray
+        Full memory access trace
+    warmup_fraction : float
+        Fraction of leading accesses to drop
+    keep_every : int
+        Keep one chunk out of this many
+    chunk_size : int
+        Maximum accesses per chunk (smaller for short traces, so that
+        every trace is sampled from start to end)
+        
+    Returns:
+    --------
+    trace_sub : np.ndarray
+        Roughly (1 - warmup_fraction) / keep_every of the accesses
+    """
+    trace = trace[int(len(trace) * warmup_fraction):]
+    chunk_size = max(1, min(chunk_size, len(trace) // (8 * keep_every)))
+    chunk_ids = np.arange(len(trace)) // chunk_size
+    return np.ascontiguousarray(trace[chunk_ids % keep_every == 0])
+
+
+def _eval_task(task: Tuple) -> Tuple[str, str, float]:
+    """
+    Evaluate one (baseline, workload) pair in a worker thread.
+    
+    Parameters:
+    -----------
+    task : tuple
+        (baseline_name, workload_name, cache_size, block_size,
+         associativity, trace_key)
+        
+    Returns:
+    --------
+    result : tuple
+        (baseline_name, workload_name, miss_rate)
+    """
+    (baseline_name, workload_name, cache_size, block_size, associativity,
+     trace_key) = task
+    miss_rate = _cached_eval(cache_size, block_size, associativity, trace_key)
+    return baseline_name, workload_name, miss_rate
+
+
+class _NumpyEncoder(json.JSONEncoder):
+    """JSON encoder that converts NumPy scalars and arrays on the fly."""
+    
+    def default(self, obj):
+        if isinstance(obj, (np.integer, np.floating)):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        return json.JSONEncoder.default(self, obj)
+
+
+def _dumps_json(value) -> bytes:
+    """Serialize value as 2-space indented JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, default=_NumpyEncoder().default,
+                            option=orjson.OPT_INDENT_2 |
+                            orjson.OPT_SERIALIZE_NUMPY |
+                            orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2, cls=_NumpyEncoder).encode()
+
+
+# Optimizer bookkeeping in history entries that is not part of the
+# results file schema
+_INTERNAL_RESULT_KEYS = ('from_cache', 'fidelity')
+
+
+def _public_config(config: Dict) -> Dict:
+    """Copy of a history entry without the optimizer's bookkeeping keys."""
+    if config is None:
+        return None
+    return {key: value for key, value in config.items()
+            if key not in _INTERNAL_RESULT_KEYS}
+
+
+def _write_json_value(f, value, level: int):
+    """Write value to binary file f as JSON, indented as if nested level deep."""
+    f.write(_dumps_json(value).replace(b'\n', b'\n' + b'  ' * level))
+
+
+class _WorkloadObjective:
+    """
+    Optimization objective for one workload: miss rate of a configuration.
+    
+    A top-level callable class rather than a closure so it can be pickled
+    into worker processes.
+    """
+    
+    def __init__(self, trace: np.ndarray, trace_key: int):
+        self.trace = trace
+        self.trace_key = trace_key
+    
+    def __call__(self, cache_size: int, block_size: int,
+                 associativity: int) -> float:
+        _register_trace(self.trace, self.trace_key)
+        return _cached_eval(cache_size, block_size, associativity,
+                            self.trace_key)
+    
+    def evaluate_batch(self, configs: List[Tuple[int, int, int]]) -> List[float]:
+        """
+        Miss rates of several configurations.
+        
+        Memoized configurations are answered from the memo; the others
+        are simulated in parallel in one kernel call and memoized.
+        """
+        _register_trace(self.trace, self.trace_key)
+        if not _USE_KERNELS:
+            return [self(*config) for config in configs]
+        memo = _miss_rates[self.trace_key]
+        missing = [config for config in dict.fromkeys(configs)
+                   if config not in memo]
+        if missing:
+            cache_sizes, block_sizes, associativities = zip(*missing)
+            miss_rates = evaluate_cache_configs_batch(
+                cache_sizes, block_sizes, associativities, self.trace)
+            memo.update(zip(missing, miss_rates.tolist()))
+        return [memo[config] for config in configs]
+
 
 class SmartCacheExperiment:
     """
@@ -48,11 +298,33 @@ class SmartCacheExperiment:
         self.seed = seed
         self.trace_generator = TraceGenerator(seed=seed)
         
+        # Trigger JIT compilation now rather than inside the first probes
+        if _USE_KERNELS:
+            warm_up()
+        
         # Results storage
         self.baseline_results = {}
         self.optimized_results = {}
         self.workloads = {}
         
+        # Report lines buffered by _log() and written by _flush_log()
+        self._log_buf: List[str] = []
+        
+        # Baseline miss rates as a (baseline x workload) matrix, built by
+        # evaluate_baselines for vectorized comparisons and plots
+        self._bmatrix = None
+        self._baseline_names: List[str] = []
+        self._bmatrix_workloads: List[str] = []
+        
+        # Shared memory copies of the traces, keyed by trace memo key
+        self._shms: Dict[int, SharedMemory] = {}
+        
+        # Keys this experiment added to the trace registry, released by
+        # release_traces(). Miss rates simulated on these traces (baselines
+        # and every BO run, including workers' results merged back in this
+        # process) are shared through the evaluation memo (_miss_rates).
+        self._trace_keys: List[int] = []
+        
     def define_baselines(self) -> Dict[str, Dict[str, int]]:
         """
         Define standard "one-size-fits-all" cache configurations.
@@ -98,7 +370,7 @@ class SmartCacheExperiment:
         
         return baselines
     
-    def generate_workloads(self, workload_types: List[str] = None) -> Dict[str, List[int]]:
+    def generate_workloads(self, workload_types: List[str] = None) -> Dict[str, np.ndarray]:
         """
         Generate suite of workload traces.
         
@@ -110,7 +382,8 @@ class SmartCacheExperiment:
         Returns:
         --------
         workloads : dict
-            Dictionary mapping workload names to traces
+            Dictionary mapping workload names to trace arrays (uint32,
+            or int64 for traces whose addresses do not fit in 32 bits)
         """
         if workload_types is None:
             # Default comprehensive suite
@@ -140,15 +413,92 @@ class SmartCacheExperiment:
                 elif wl_type == 'mixed':
                     workloads[wl_type] = self.trace_generator.mixed_workload_trace(5000)
         
+        # Contiguous storage: 4 bytes per access instead of a boxed int,
+        # and a single buffer to pickle or hand to compiled kernels
+        for name, trace in workloads.items():
+            workloads[name] = as_trace_array(trace)
+        
         self.workloads = workloads
         return workloads
     
+    def _register_trace(self, trace, trace_key: int = None) -> int:
+        """Register a trace for memoized evaluation until release_traces()."""
+        if trace_key is None:
+            trace_key = id(trace)
+        if trace_key not in _trace_registry:
+            self._trace_keys.append(trace_key)
+        return _register_trace(trace, trace_key)
+    
+    def release_traces(self):
+        """Drop the traces this experiment registered for evaluation."""
+        _unregister_trace(*self._trace_keys)
+        self._trace_keys.clear()
+    
+    def _share_trace(self, trace) -> Tuple[int, str, Tuple[int, ...], str]:
+        """
+        Place a trace in shared memory for worker processes.
+        
+        Each trace is copied into a segment once; tasks then carry only
+        the segment name and shape instead of pickling the whole trace.
+        Segments live until close_shms().
+        
+        Parameters:
+        -----------
+        trace : array-like
+            Memory access trace
+            
+        Returns:
+        --------
+        handle : tuple
+            (trace_key, shm_name, shape, dtype)
+        """
+        trace_key = self._register_trace(trace)
+        arr = as_trace_array(trace)
+        shm = self._shms.get(trace_key)
+        if shm is None:
+            shm = SharedMemory(create=True, size=max(1, arr.nbytes))
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+            self._shms[trace_key] = shm
+        return trace_key, shm.name, arr.shape, arr.dtype.str
+    
+    def _log(self, line: str):
+        """Buffer one line of a report section."""
+        self._log_buf.append(line)
+    
+    def _flush_log(self):
+        """Write the buffered report lines to stdout in a single call."""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            sys.stdout.flush()
+            self._log_buf.clear()
+    
+    def _merge_history(self, trace_key: int, history: List[Dict]):
+        """Add the full-fidelity simulations of a worker's BO run to the memo."""
+        memo = _miss_rates[trace_key]
+        for entry in history:
+            if entry.get('fidelity', 'full') == 'full':
+                key = (entry['cache_size'], entry['block_size'],
+                       entry['associativity'])
+                memo[key] = entry['miss_rate']
+    
+    def close_shms(self):
+        """Release the shared memory segments holding workload traces."""
+        for shm in self._shms.values():
+            shm.close()
+            shm.unlink()
+        self._shms.clear()
+    
+    def __del__(self):
+        self.close_shms()
+        self.release_traces()
+    
     def evaluate_baselines(self, baselines: Dict, workloads: Dict) -> Dict:
         """
         Evaluate all baseline configurations on all workloads.
         
         This establishes the performance of "one-size-fits-all" designs
-        that don't adapt to specific workload characteristics.
+        that don't adapt to specific workload characteristics. The
+        (baseline, workload) simulations run in parallel worker threads.
         
         Parameters:
         -----------
@@ -162,36 +512,65 @@ class SmartCacheExperiment:
         results : dict
             Nested dict: results[baseline_name][workload_name] = miss_rate
         """
-        results = {}
+        results = {name: {} for name in baselines}
         
-        print("="*70)
-        print("EVALUATING BASELINE CONFIGURATIONS")
-        print("="*70)
+        # Every (baseline, workload) pair is an independent simulation.
+        # Pairs already in the evaluation memo are not simulated again.
+        trace_keys = {name: self._register_trace(trace)
+                      for name, trace in workloads.items()}
+        tasks = []
+        for baseline_name, config in baselines.items():
+            key = (config['cache_size'], config['block_size'],
+                   config['associativity'])
+            for workload_name in workloads:
+                cached = _miss_rates[trace_keys[workload_name]].get(key)
+                if cached is not None:
+                    results[baseline_name][workload_name] = cached
+                else:
+                    tasks.append((baseline_name, workload_name, *key,
+                                  trace_keys[workload_name]))
+        
+        # The compiled kernels release the GIL, so threads simulate in
+        # parallel while sharing the traces in this address space
+        max_workers = os.cpu_count() or 1
+        
+        if tasks:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for baseline_name, workload_name, miss_rate in \
+                        executor.map(_eval_task, tasks):
+                    results[baseline_name][workload_name] = miss_rate
+        
+        self._log("="*70)
+        self._log("EVALUATING BASELINE CONFIGURATIONS")
+        self._log("="*70)
         
         for baseline_name, config in baselines.items():
-            results[baseline_name] = {}
-            print(f"\nBaseline: {baseline_name}")
-            print(f"   {config['description']}")
-            print(f"   Size={config['cache_size']}B, Block={config['block_size']}B, "
-                  f"Assoc={config['associativity']}")
-            print()
+            self._log(f"\nBaseline: {baseline_name}")
+            self._log(f"   {config['description']}")
+            self._log(f"   Size={config['cache_size']}B, Block={config['block_size']}B, "
+                      f"Assoc={config['associativity']}")
+            self._log("")
             
-            for workload_name, trace in workloads.items():
-                miss_rate = evaluate_cache_config(
-                    config['cache_size'],
-                    config['block_size'],
-                    config['associativity'],
-                    trace
-                )
-                results[baseline_name][workload_name] = miss_rate
-                print(f"   {workload_name:15s}: Miss Rate = {miss_rate:.4f}")
+            for workload_name in workloads:
+                miss_rate = results[baseline_name][workload_name]
+                self._log(f"   {workload_name:15s}: Miss Rate = {miss_rate:.4f}")
         
-        print("\n" + "="*70)
+        self._log("\n" + "="*70)
+        self._flush_log()
         self.baseline_results = results
+        self._baseline_names = list(baselines)
+        self._bmatrix_workloads = list(workloads)
+        self._bmatrix = np.array([[results[bn][wn] for wn in workloads]
+                                  for bn in baselines], dtype=np.float64)
         return results
     
     def run_ai_optimization(self, workload_name: str, trace: List[int],
-                           n_calls: int = 50, verbose: bool = False) -> Dict:
+                           n_calls: int = 50, verbose: bool = False,
+                           trace_key: int = None,
+                           multi_fidelity: bool = False,
+                           batch_size: int = 1,
+                           prime_sets: bool = False,
+                           n_jobs: int = 1) -> Dict:
         """
         Run AI-driven optimization for a specific workload.
         
@@ -209,6 +588,22 @@ class SmartCacheExperiment:
             Optimization budget (number of configurations to try)
         verbose : bool
             Print detailed optimization progress
+        trace_key : int, optional
+            Memo key of the trace (assigned by the parent process when
+            running in a worker)
+        multi_fidelity : bool
+            Opt in to evaluating the first half of the budget on a
+            warm-up-trimmed, subsampled trace (see _subsample_trace); the
+            best configuration is always chosen on the full trace
+        batch_size : int
+            Candidates proposed per surrogate fit; each batch (and the
+            initial design) is simulated in parallel in one kernel call
+        prime_sets : bool
+            Search only configurations whose number of sets is padded to
+            a prime (see BayesianCacheOptimizer)
+        n_jobs : int
+            Worker processes simulating each batch instead of the single
+            batched kernel call (see BayesianCacheOptimizer.optimize)
             
         Returns:
         --------
@@ -218,20 +613,36 @@ class SmartCacheExperiment:
         print(f"\nOptimizing for: {workload_name}")
         print("-" * 70)
         
+        # Convert once; every objective call shares this read-only array
+        trace_key = self._register_trace(trace, trace_key)
+        trace = as_trace_array(trace)
+        
         # Create objective function for this workload
-        def objective(cache_size, block_size, associativity):
-            return evaluate_cache_config(cache_size, block_size, 
-                                        associativity, trace)
+        objective = _WorkloadObjective(trace, trace_key)
+        low_fidelity_objective = None
+        if multi_fidelity:
+            # Registered for this run only
+            trace_sub = _subsample_trace(trace)
+            low_fidelity_objective = _WorkloadObjective(
+                trace_sub, _register_trace(trace_sub))
         
         # Run Bayesian optimization
         optimizer = BayesianCacheOptimizer(
             max_cache_size=self.max_cache_size,
             n_calls=n_calls,
-            verbose=verbose
+            verbose=verbose,
+            prime_sets=prime_sets
         )
         
         start_time = time.time()
-        result = optimizer.optimize(objective)
+        try:
+            result = optimizer.optimize(
+                objective, batch_size=batch_size, n_jobs=n_jobs,
+                low_fidelity_objective=low_fidelity_objective,
+                known_results=_miss_rates[trace_key])
+        finally:
+            if low_fidelity_objective is not None:
+                _unregister_trace(low_fidelity_objective.trace_key)
         elapsed_time = time.time() - start_time
         
         result['workload_name'] = workload_name
@@ -242,10 +653,16 @@ class SmartCacheExperiment:
     
     def optimize_all_workloads(self, workloads: Dict, 
                               n_calls: int = 50,
-                              verbose: bool = False) -> Dict:
+                              verbose: bool = False,
+                              max_workers: int = None,
+                              batch_size: int = 1,
+                              prime_sets: bool = False,
+                              multi_fidelity: bool = False) -> Dict:
         """
         Run AI optimization for all workloads.
         
+        Workloads are optimized in parallel worker processes.
+        
         Parameters:
         -----------
         workloads : dict
@@ -254,6 +671,18 @@ class SmartCacheExperiment:
             Optimization budget per workload
         verbose : bool
             Detailed progress output
+        max_workers : int, optional
+            Worker processes to use; defaults to one per workload, capped
+            at the CPU count. 1 optimizes the workloads in this process
+        batch_size : int
+            Candidates proposed per surrogate fit (constant liar); each
+            batch is simulated in parallel (see run_ai_optimization)
+        prime_sets : bool
+            Search only configurations with a prime number of sets (see
+            run_ai_optimization)
+        multi_fidelity : bool
+            Spend the first half of each budget on a subsampled trace (see
+            run_ai_optimization)
             
         Returns:
         --------
@@ -266,11 +695,47 @@ class SmartCacheExperiment:
         print("AI-DRIVEN OPTIMIZATION FOR ALL WORKLOADS")
         print("="*70)
         
-        for workload_name, trace in workloads.items():
-            result = self.run_ai_optimization(
-                workload_name, trace, n_calls, verbose
-            )
-            results[workload_name] = result
+        # Each workload is an independent optimization run
+        if max_workers is None:
+            max_workers = min(len(workloads), os.cpu_count() or 1)
+        if max_workers <= 1:
+            for workload_name, trace in workloads.items():
+                results[workload_name] = self.run_ai_optimization(
+                    workload_name, trace, n_calls, verbose,
+                    batch_size=batch_size, prime_sets=prime_sets,
+                    multi_fidelity=multi_fidelity)
+            self.optimized_results = results
+            return results
+        
+        # Traces reach the workers through shared memory segments, created
+        # here and released once the pool is done with them
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=_SPAWN) as executor:
+                futures = {}
+                for workload_name, trace in workloads.items():
+                    handle = self._share_trace(trace)
+                    future = executor.submit(_run_ai_optimization_task,
+                                             self.max_cache_size, self.seed,
+                                             workload_name, handle,
+                                             n_calls, verbose,
+                                             _miss_rates[handle[0]],
+                                             batch_size, prime_sets,
+                                             multi_fidelity)
+                    futures[future] = workload_name, handle[0]
+                completed = {}
+                for future in as_completed(futures):
+                    workload_name, trace_key = futures[future]
+                    completed[workload_name] = future.result()
+                    # Merge the worker's share of the evaluation memo
+                    self._merge_history(trace_key,
+                                        completed[workload_name]['history'])
+        finally:
+            self.close_shms()
+        
+        # Keep workload order regardless of completion order
+        for workload_name in workloads:
+            results[workload_name] = completed[workload_name]
         
         self.optimized_results = results
         return results
@@ -295,32 +760,41 @@ class SmartCacheExperiment:
         
         comparison = {}
         
-        print("\n" + "="*70)
-        print("PERFORMANCE COMPARISON: AI-OPTIMIZED vs. BASELINES")
-        print("="*70)
+        self._log("\n" + "="*70)
+        self._log("PERFORMANCE COMPARISON: AI-OPTIMIZED vs. BASELINES")
+        self._log("="*70)
         
-        for workload_name in self.workloads.keys():
-            # Get AI-optimized result
-            ai_miss_rate = self.optimized_results[workload_name]['best_miss_rate']
-            
-            # Get baseline results
-            baseline_miss_rates = {
-                name: results[workload_name]
-                for name, results in self.baseline_results.items()
-            }
-            
-            # Find best baseline
-            best_baseline_name = min(baseline_miss_rates, 
-                                    key=baseline_miss_rates.get)
-            best_baseline_miss_rate = baseline_miss_rates[best_baseline_name]
-            
-            # Calculate improvement
-            absolute_improvement = best_baseline_miss_rate - ai_miss_rate
-            if best_baseline_miss_rate > 0:
-                relative_improvement = (absolute_improvement / 
-                                      best_baseline_miss_rate) * 100
-            else:
-                relative_improvement = 0
+        workload_names = list(self.workloads.keys())
+        
+        # Baseline matrix columns for these workloads (rebuilt from
+        # baseline_results if they were not produced by evaluate_baselines)
+        if self._bmatrix is not None and \
+                set(workload_names) <= set(self._bmatrix_workloads):
+            baseline_names = self._baseline_names
+            columns = [self._bmatrix_workloads.index(wn)
+                       for wn in workload_names]
+            bmatrix = self._bmatrix[:, columns]
+        else:
+            baseline_names = list(self.baseline_results)
+            bmatrix = np.array([[self.baseline_results[bn][wn]
+                                 for wn in workload_names]
+                                for bn in baseline_names], dtype=np.float64)
+        
+        # Best baseline and improvements for every workload at once
+        ai = np.array([self.optimized_results[wn]['best_miss_rate']
+                       for wn in workload_names], dtype=np.float64)
+        best_idx = bmatrix.argmin(axis=0)
+        best = bmatrix.min(axis=0)
+        absolute = best - ai
+        safe_best = np.where(best > 0, best, 1.0)
+        relative = np.where(best > 0, absolute / safe_best * 100.0, 0.0)
+        
+        for j, workload_name in enumerate(workload_names):
+            ai_miss_rate = float(ai[j])
+            best_baseline_name = baseline_names[best_idx[j]]
+            best_baseline_miss_rate = float(best[j])
+            absolute_improvement = float(absolute[j])
+            relative_improvement = float(relative[j])
             
             comparison[workload_name] = {
                 'ai_miss_rate': ai_miss_rate,
@@ -328,86 +802,87 @@ class SmartCacheExperiment:
                 'best_baseline_miss_rate': best_baseline_miss_rate,
                 'absolute_improvement': absolute_improvement,
                 'relative_improvement_pct': relative_improvement,
-                'all_baselines': baseline_miss_rates
+                'all_baselines': dict(zip(baseline_names,
+                                          bmatrix[:, j].tolist()))
             }
             
-            print(f"\n{workload_name}:")
-            print(f"   AI-Optimized:     {ai_miss_rate:.4f}")
-            print(f"   Best Baseline:    {best_baseline_miss_rate:.4f} ({best_baseline_name})")
-            print(f"   Improvement:      {absolute_improvement:.4f} "
-                  f"({relative_improvement:+.1f}%)")
+            self._log(f"\n{workload_name}:")
+            self._log(f"   AI-Optimized:     {ai_miss_rate:.4f}")
+            self._log(f"   Best Baseline:    {best_baseline_miss_rate:.4f} ({best_baseline_name})")
+            self._log(f"   Improvement:      {absolute_improvement:.4f} "
+                      f"({relative_improvement:+.1f}%)")
             
             if relative_improvement > 0:
-                print(f"   AI wins by {relative_improvement:.1f}%")
+                self._log(f"   AI wins by {relative_improvement:.1f}%")
             else:
-                print(f"   WARNING: Baseline competitive")
+                self._log(f"   WARNING: Baseline competitive")
         
-        print("\n" + "="*70)
+        self._log("\n" + "="*70)
         
         # Summary statistics
-        improvements = [c['relative_improvement_pct'] for c in comparison.values()]
-        print(f"\nSUMMARY STATISTICS:")
-        print(f"   Average Improvement: {np.mean(improvements):.1f}%")
-        print(f"   Median Improvement:  {np.median(improvements):.1f}%")
-        print(f"   Best Improvement:    {np.max(improvements):.1f}%")
-        print(f"   Worst Case:          {np.min(improvements):.1f}%")
-        print("="*70)
+        self._log(f"\nSUMMARY STATISTICS:")
+        self._log(f"   Average Improvement: {np.mean(relative):.1f}%")
+        self._log(f"   Median Improvement:  {np.median(relative):.1f}%")
+        self._log(f"   Best Improvement:    {np.max(relative):.1f}%")
+        self._log(f"   Worst Case:          {np.min(relative):.1f}%")
+        self._log("="*70)
+        self._flush_log()
         
         return comparison
     
-    def _convert_numpy_types(self, obj):
-        """Convert numpy types to native Python types for JSON serialization."""
-        if isinstance(obj, (np.integer, np.int64, np.int32)):
-            return int(obj)
-        elif isinstance(obj, (np.floating, np.float64, np.float32)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, dict):
-            return {key: self._convert_numpy_types(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_numpy_types(item) for item in obj]
-        return obj
-    
     def save_results(self, filename: str = 'experiment_results.json'):
         """
         Save all experimental results to JSON file.
         
+        The file is written incrementally, one workload at a time, and
+        NumPy values are converted while encoding, so no converted copy of
+        all results is built in memory. Configurations keep only their
+        cache parameters and miss rate; the optimizer's bookkeeping keys
+        (from_cache, fidelity) are not written.
+        
         Parameters:
         -----------
         filename : str
             Output filename
         """
-        results = {
-            'baselines': self.baseline_results,
-            'optimized': {
-                name: {
-                    'best_config': result['best_config'],
-                    'best_miss_rate': result['best_miss_rate'],
-                    'optimization_time': result['optimization_time'],
-                    'pareto_frontier': result['pareto_frontier']
-                }
-                for name, result in self.optimized_results.items()
-            },
-            'workload_stats': {
-                name: {
-                    'num_accesses': len(trace),
-                    'unique_addresses': len(set(trace))
-                }
-                for name, trace in self.workloads.items()
+        # Trace statistics in a single vectorized pass per workload
+        workload_stats = {}
+        for name, trace in self.workloads.items():
+            trace = as_trace_array(trace)
+            workload_stats[name] = {
+                'num_accesses': int(trace.size),
+                'unique_addresses': int(np.unique(trace).size)
             }
-        }
-        
-        # Convert numpy types to native Python types
-        results = self._convert_numpy_types(results)
         
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(b'{\n  "baselines": ')
+            _write_json_value(f, self.baseline_results, 1)
+            
+            f.write(b',\n  "optimized": {')
+            for i, (name, result) in enumerate(self.optimized_results.items()):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(_dumps_json(name) + b': ')
+                _write_json_value(f, {
+                    'best_config': _public_config(result['best_config']),
+                    'best_miss_rate': result['best_miss_rate'],
+                    'optimization_time': result['optimization_time'],
+                    'pareto_frontier': [_public_config(config) for config
+                                        in result['pareto_frontier']]
+                }, 2)
+            f.write(b'\n  }' if self.optimized_results else b'}')
+            
+            f.write(b',\n  "workload_stats": ')
+            _write_json_value(f, workload_stats, 1)
+            f.write(b'\n}')
         
         print(f"\nResults saved to {filename}")
     
     def run_full_experiment(self, n_calls: int = 50, 
-                           save_results: bool = True) -> Dict:
+                           save_results: bool = True,
+                           max_workers: int = None,
+                           batch_size: int = 1,
+                           prime_sets: bool = False,
+                           multi_fidelity: bool = False) -> Dict:
         """
         Run complete experimental workflow.
         
@@ -425,6 +900,15 @@ class SmartCacheExperiment:
             Optimization budget per workload
         save_results : bool
             Save results to JSON
+        max_workers : int, optional
+            Worker processes for the per-workload optimizations (see
+            optimize_all_workloads)
+        batch_size : int
+            Candidates proposed per surrogate fit
+        prime_sets : bool
+            Search only configurations with a prime number of sets
+        multi_fidelity : bool
+            Spend the first half of each budget on a subsampled trace
             
         Returns:
         --------
@@ -454,7 +938,9 @@ class SmartCacheExperiment:
         
         # Step 4: AI optimization
         optimized_results = self.optimize_all_workloads(
-            workloads, n_calls=n_calls, verbose=False
+            workloads, n_calls=n_calls, verbose=False,
+            max_workers=max_workers, batch_size=batch_size,
+            prime_sets=prime_sets, multi_fidelity=multi_fidelity
         )
         
         # Step 5: Performance comparison
@@ -471,6 +957,34 @@ class SmartCacheExperiment:
         }
 
 
+def _run_ai_optimization_task(max_cache_size: int, seed: int,
+                              workload_name: str,
+                              handle: Tuple[int, str, Tuple[int, ...], str],
+                              n_calls: int, verbose: bool,
+                              known_results: Dict[Tuple[int, int, int], float],
+                              batch_size: int = 1,
+                              prime_sets: bool = False,
+                              multi_fidelity: bool = False) -> Dict:
+    """
+    Run one workload's optimization in a worker process.
+    
+    Builds a lightweight experiment instead of pickling the caller's,
+    which holds every workload trace; the trace itself is read from the
+    shared memory segment named in handle (trace_key, shm_name, shape,
+    dtype).
+    known_results seeds this process's evaluation memo for the trace.
+    """
+    trace_key = handle[0]
+    trace = _attach_trace(*handle)
+    _miss_rates[trace_key].update(known_results)
+    experiment = SmartCacheExperiment(max_cache_size=max_cache_size, seed=seed)
+    return experiment.run_ai_optimization(workload_name, trace, n_calls,
+                                          verbose, trace_key,
+                                          batch_size=batch_size,
+                                          prime_sets=prime_sets,
+                                          multi_fidelity=multi_fidelity)
+
+
 if __name__ == "__main__":
     # Run demonstration experiment
     print("SmartCache Experiment Framework - Demonstration")
@@ -18,9 +18,12 @@ Modes:
 """
 
 import argparse
+import os
 import sys
 import time
-from typing import Dict, List
+from typing import Callable, Dict, List
+
+import numpy as np
 
 from cache_simulator import CacheSimulator
 from trace_generator import TraceGenerator
@@ -29,6 +32,58 @@ from experiment_framework import SmartCacheExperiment
 from visualize_results import SmartCacheVisualizer
 
 
+# Quick-demo traces are saved here on first use and reloaded by later runs
+TRACE_CACHE_DIR = 'traces'
+# Bumped whenever trace_generator's output for a given seed changes, so
+# traces cached by older versions are not reused
+TRACE_CACHE_VERSION = 2
+
+
+def _print_lines(lines: List[str]):
+    """Write a block of output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _cached_trace(name: str, builder: Callable[[], np.ndarray],
+                  seed: int) -> np.ndarray:
+    """
+    Load a trace from TRACE_CACHE_DIR, or build it and save it there.
+    
+    Traces are stored compressed as v{TRACE_CACHE_VERSION}_{seed}_{name}.npz.
+    Delete the directory to regenerate them (e.g. after changing
+    trace_generator).
+    
+    Parameters:
+    -----------
+    name : str
+        Workload name (must identify the trace parameters)
+    builder : Callable
+        Generates the trace when it is not cached
+    seed : int
+        Seed of the generator the trace comes from
+        
+    Returns:
+    --------
+    trace : np.ndarray
+        Memory access trace
+    """
+    path = os.path.join(TRACE_CACHE_DIR,
+                        f"v{TRACE_CACHE_VERSION}_{seed}_{name}.npz")
+    if os.path.exists(path):
+        with np.load(path) as data:
+            return data['arr']
+    
+    trace = builder()
+    # Write-then-rename so an interrupted run never leaves a truncated file
+    os.makedirs(TRACE_CACHE_DIR, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez_compressed(f, arr=trace)
+    os.replace(tmp_path, path)
+    return trace
+
+
 def print_banner():
     """Print welcome banner."""
     banner = """
@@ -43,11 +98,11 @@ def print_banner():
     try:
         print(banner)
     except UnicodeEncodeError:
-        print("SmartCache AI Optimization Framework")
-        print("=" * 70)
+        _print_lines(["SmartCache AI Optimization Framework", "=" * 70])
 
 
-def run_quick_demo():
+def run_quick_demo(jobs: int = None, batch: int = 1,
+                   prime_sets: bool = False, multi_fidelity: bool = False):
     """
     Run a quick demonstration with reduced workloads.
     
@@ -57,23 +112,44 @@ def run_quick_demo():
     - Quick validation
     
     Duration: ~5 minutes
+    
+    Parameters:
+    -----------
+    jobs : int, optional
+        Worker processes for the per-workload optimizations
+        (default: one per workload, up to the CPU count)
+    batch : int
+        Candidate configurations proposed and simulated together per
+        surrogate fit
+    prime_sets : bool
+        Search only cache configurations with a prime number of sets
+    multi_fidelity : bool
+        Spend the first half of each optimization budget on a cheaper,
+        subsampled trace
     """
-    print("\n" + "="*70)
-    print("QUICK DEMONSTRATION MODE")
-    print("="*70)
-    print("This will run a fast demo with reduced workloads.")
-    print("Estimated time: 5 minutes\n")
+    _print_lines([
+        "\n" + "="*70,
+        "QUICK DEMONSTRATION MODE",
+        "="*70,
+        "This will run a fast demo with reduced workloads.",
+        "Estimated time: 5 minutes\n"
+    ])
     
     # Create experiment
     experiment = SmartCacheExperiment(max_cache_size=32768, seed=42)
     
-    # Generate small workload suite
+    # Generate small workload suite (reused from TRACE_CACHE_DIR if present)
     print("Generating workloads...")
+    generator = experiment.trace_generator
+    builders = {
+        'matmul_32': lambda: generator.matrix_multiplication_trace(32),
+        'sort_1k': lambda: generator.quicksort_trace(1000),
+        'sequential': lambda: generator.sequential_scan_trace(2000),
+        'stride_8': lambda: generator.strided_access_trace(2000, stride=8),
+    }
     workloads = {
-        'matmul_32': experiment.trace_generator.matrix_multiplication_trace(32),
-        'sort_1k': experiment.trace_generator.quicksort_trace(1000),
-        'sequential': experiment.trace_generator.sequential_scan_trace(2000),
-        'stride_8': experiment.trace_generator.strided_access_trace(2000, stride=8),
+        name: _cached_trace(name, builder, experiment.seed)
+        for name, builder in builders.items()
     }
     experiment.workloads = workloads  # Store workloads in experiment object
     print(f"   Generated {len(workloads)} workload traces\n")
@@ -87,7 +163,10 @@ def run_quick_demo():
     
     # Run AI optimization (reduced budget for speed)
     print("\nRunning AI optimization (20 evaluations per workload)...")
-    experiment.optimize_all_workloads(workloads, n_calls=20, verbose=False)
+    experiment.optimize_all_workloads(workloads, n_calls=20, verbose=False,
+                                      max_workers=jobs, batch_size=batch,
+                                      prime_sets=prime_sets,
+                                      multi_fidelity=multi_fidelity)
     
     # Compare results
     print("\nAnalyzing results...")
@@ -111,19 +190,23 @@ def run_quick_demo():
     viz.plot_ai_vs_baseline_comparison(comparison,
                                       save_path='quick_demo_comparison.png')
     
-    print("\n" + "="*70)
-    print("QUICK DEMO COMPLETE!")
-    print("="*70)
-    print("Results saved to:")
-    print("  - quick_demo_results.json")
-    print("  - quick_demo_pareto.png")
-    print("  - quick_demo_comparison.png")
-    print("\nKey Takeaway: AI-driven optimization adapts cache configurations")
-    print("              to workload characteristics, outperforming static designs.")
-    print("="*70)
+    _print_lines([
+        "\n" + "="*70,
+        "QUICK DEMO COMPLETE!",
+        "="*70,
+        "Results saved to:",
+        "  - quick_demo_results.json",
+        "  - quick_demo_pareto.png",
+        "  - quick_demo_comparison.png",
+        "\nKey Takeaway: AI-driven optimization adapts cache configurations",
+        "              to workload characteristics, outperforming static designs.",
+        "="*70
+    ])
 
 
-def run_full_experiment():
+def run_full_experiment(jobs: int = None, batch: int = 1,
+                        prime_sets: bool = False,
+                        multi_fidelity: bool = False):
     """
     Run comprehensive experiment with complete workload suite.
     
@@ -134,13 +217,29 @@ def run_full_experiment():
     - Publication-ready results
     
     Duration: 30-60 minutes
+    
+    Parameters:
+    -----------
+    jobs : int, optional
+        Worker processes for the per-workload optimizations
+        (default: one per workload, up to the CPU count)
+    batch : int
+        Candidate configurations proposed and simulated together per
+        surrogate fit
+    prime_sets : bool
+        Search only cache configurations with a prime number of sets
+    multi_fidelity : bool
+        Spend the first half of each optimization budget on a cheaper,
+        subsampled trace
     """
-    print("\n" + "="*70)
-    print("FULL EXPERIMENT MODE")
-    print("="*70)
-    print("This will run the complete experiment with all workloads.")
-    print("Estimated time: 30-60 minutes")
-    print("="*70)
+    _print_lines([
+        "\n" + "="*70,
+        "FULL EXPERIMENT MODE",
+        "="*70,
+        "This will run the complete experiment with all workloads.",
+        "Estimated time: 30-60 minutes",
+        "="*70
+    ])
     
     response = input("\nProceed with full experiment? (y/n): ")
     if response.lower() != 'y':
@@ -155,7 +254,11 @@ def run_full_experiment():
     # Run full workflow
     results = experiment.run_full_experiment(
         n_calls=50,  # Full optimization budget
-        save_results=True
+        save_results=True,
+        max_workers=jobs,
+        batch_size=batch,
+        prime_sets=prime_sets,
+        multi_fidelity=multi_fidelity
     )
     
     elapsed_time = time.time() - start_time
@@ -195,54 +298,75 @@ def run_full_experiment():
             save_path=f'design_space_{workload_name}.png'
         )
     
-    print("\n" + "="*70)
-    print("FULL EXPERIMENT COMPLETE!")
-    print("="*70)
-    print(f"Total time: {elapsed_time/60:.1f} minutes")
-    print("\nResults saved to:")
-    print("  - experiment_results.json")
-    print("  - full_experiment_comparison.png")
-    print("  - full_experiment_multi_pareto.png")
-    print("  - convergence_*.png (per workload)")
-    print("  - design_space_*.png (per workload)")
-    print("\n" + "="*70)
-    print("KEY FINDINGS:")
-    print("="*70)
-    
-    # Print summary statistics
+    # Summary statistics
     improvements = [c['relative_improvement_pct'] 
                    for c in results['comparison'].values()]
-    print(f"Average Improvement over Best Baseline: {sum(improvements)/len(improvements):.1f}%")
-    print(f"Best Case Improvement: {max(improvements):.1f}%")
-    print(f"Worst Case: {min(improvements):.1f}%")
-    
-    print("\nConclusion: AI-driven optimization consistently outperforms")
-    print("            static 'one-size-fits-all' cache designs by learning")
-    print("            workload-specific configurations.")
-    print("="*70)
+    
+    _print_lines([
+        "\n" + "="*70,
+        "FULL EXPERIMENT COMPLETE!",
+        "="*70,
+        f"Total time: {elapsed_time/60:.1f} minutes",
+        "\nResults saved to:",
+        "  - experiment_results.json",
+        "  - full_experiment_comparison.png",
+        "  - full_experiment_multi_pareto.png",
+        "  - convergence_*.png (per workload)",
+        "  - design_space_*.png (per workload)",
+        "\n" + "="*70,
+        "KEY FINDINGS:",
+        "="*70,
+        f"Average Improvement over Best Baseline: {sum(improvements)/len(improvements):.1f}%",
+        f"Best Case Improvement: {max(improvements):.1f}%",
+        f"Worst Case: {min(improvements):.1f}%",
+        "\nConclusion: AI-driven optimization consistently outperforms",
+        "            static 'one-size-fits-all' cache designs by learning",
+        "            workload-specific configurations.",
+        "="*70
+    ])
 
 
-def run_custom_experiment():
+def run_custom_experiment(jobs: int = None, batch: int = 1,
+                          prime_sets: bool = False,
+                          multi_fidelity: bool = False):
     """
     Run customizable experiment with user-specified parameters.
+    
+    Parameters:
+    -----------
+    jobs : int, optional
+        Worker processes for the per-workload optimizations
+        (default: one per workload, up to the CPU count)
+    batch : int
+        Candidate configurations proposed and simulated together per
+        surrogate fit
+    prime_sets : bool
+        Search only cache configurations with a prime number of sets
+    multi_fidelity : bool
+        Spend the first half of each optimization budget on a cheaper,
+        subsampled trace
     """
-    print("\n" + "="*70)
-    print("CUSTOM EXPERIMENT MODE")
-    print("="*70)
-    print("Configure your own experiment parameters.\n")
+    _print_lines([
+        "\n" + "="*70,
+        "CUSTOM EXPERIMENT MODE",
+        "="*70,
+        "Configure your own experiment parameters.\n"
+    ])
     
     # Get user inputs
     try:
         max_cache_size = int(input("Max cache size (bytes) [default: 65536]: ") or "65536")
         n_calls = int(input("Optimization budget per workload [default: 50]: ") or "50")
         
-        print("\nAvailable workload types:")
-        print("  1. matmul_N (matrix multiplication, N=32,64,128)")
-        print("  2. sort_N (quicksort, N=1000,5000,10000)")
-        print("  3. sequential (sequential array access)")
-        print("  4. random (random access)")
-        print("  5. stride_N (strided access, N=stride)")
-        print("  6. mixed (mixed workload)")
+        _print_lines([
+            "\nAvailable workload types:",
+            "  1. matmul_N (matrix multiplication, N=32,64,128)",
+            "  2. sort_N (quicksort, N=1000,5000,10000)",
+            "  3. sequential (sequential array access)",
+            "  4. random (random access)",
+            "  5. stride_N (strided access, N=stride)",
+            "  6. mixed (mixed workload)"
+        ])
         
         workload_input = input("\nEnter workload types (comma-separated) or 'all': ")
         
@@ -262,7 +386,10 @@ def run_custom_experiment():
         # Run experiment
         print("\nStarting custom experiment...")
         experiment.evaluate_baselines(baselines, workloads)
-        experiment.optimize_all_workloads(workloads, n_calls=n_calls, verbose=False)
+        experiment.optimize_all_workloads(workloads, n_calls=n_calls, verbose=False,
+                                          max_workers=jobs, batch_size=batch,
+                                          prime_sets=prime_sets,
+                                          multi_fidelity=multi_fidelity)
         comparison = experiment.compare_performance()
         
         # Save results
@@ -285,14 +412,16 @@ def test_installation():
     """
     Test that all components are working correctly.
     """
-    print("\n" + "="*70)
-    print("TESTING INSTALLATION")
-    print("="*70)
+    _print_lines([
+        "\n" + "="*70,
+        "TESTING INSTALLATION",
+        "="*70
+    ])
     
     try:
         print("\n1. Testing Cache Simulator...")
         cache = CacheSimulator(cache_size=4096, block_size=64, associativity=4)
-        trace = [i * 64 for i in range(100)]
+        trace = np.arange(100, dtype=np.uint32) * 64
         results = cache.run_trace(trace)
         print(f"   Simulator working. Miss rate: {results['miss_rate']:.4f}")
         
@@ -313,22 +442,37 @@ def test_installation():
         viz = SmartCacheVisualizer()
         print("   Visualizer initialized successfully")
         
-        print("\n" + "="*70)
-        print("ALL TESTS PASSED!")
-        print("="*70)
-        print("Installation is working correctly.")
-        print("You can now run experiments with confidence.")
-        print("="*70)
+        _print_lines([
+            "\n" + "="*70,
+            "ALL TESTS PASSED!",
+            "="*70,
+            "Installation is working correctly.",
+            "You can now run experiments with confidence.",
+            "="*70
+        ])
         
         return True
         
     except Exception as e:
-        print(f"\nTEST FAILED: {e}")
-        print("\nPlease check that all dependencies are installed:")
-        print("  pip install numpy scipy scikit-optimize matplotlib seaborn")
+        _print_lines([
+            f"\nTEST FAILED: {e}",
+            "\nPlease check that all dependencies are installed:",
+            "  pip install numpy scipy scikit-optimize matplotlib"
+        ])
         return False
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that need a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -350,6 +494,19 @@ For more information, see README.md
                        help='Experiment mode')
     parser.add_argument('--test', action='store_true',
                        help='Test installation')
+    parser.add_argument('--jobs', type=_positive_int, default=None,
+                       help='Worker processes for optimizing workloads in '
+                            'parallel (default: one per workload, up to the '
+                            'CPU count; 1 = sequential)')
+    parser.add_argument('--batch', type=_positive_int, default=1,
+                       help='Candidate configurations proposed per surrogate '
+                            'fit and simulated in parallel (default: 1)')
+    parser.add_argument('--prime-sets', action='store_true',
+                       help='Search only cache configurations whose number '
+                            'of sets is padded down to a prime')
+    parser.add_argument('--multi-fidelity', action='store_true',
+                       help='Evaluate the first half of each optimization '
+                            'budget on a cheaper, subsampled trace')
     
     args = parser.parse_args()
     
@@ -362,15 +519,17 @@ For more information, see README.md
     
     # If no mode specified, show interactive menu
     if not args.mode:
-        print("\n" + "="*70)
-        print("SELECT EXPERIMENT MODE:")
-        print("="*70)
-        print("1. Quick Demo      - Fast demonstration (5 min)")
-        print("2. Full Experiment - Complete workload suite (30-60 min)")
-        print("3. Custom          - Configure your own experiment")
-        print("4. Test            - Test installation")
-        print("5. Exit")
-        print("="*70)
+        _print_lines([
+            "\n" + "="*70,
+            "SELECT EXPERIMENT MODE:",
+            "="*70,
+            "1. Quick Demo      - Fast demonstration (5 min)",
+            "2. Full Experiment - Complete workload suite (30-60 min)",
+            "3. Custom          - Configure your own experiment",
+            "4. Test            - Test installation",
+            "5. Exit",
+            "="*70
+        ])
         
         choice = input("\nEnter choice (1-5): ")
         
@@ -392,11 +551,14 @@ For more information, see README.md
     
     # Run selected mode
     if args.mode == 'quick':
-        run_quick_demo()
+        run_quick_demo(args.jobs, args.batch, args.prime_sets,
+                       args.multi_fidelity)
     elif args.mode == 'full':
-        run_full_experiment()
+        run_full_experiment(args.jobs, args.batch, args.prime_sets,
+                            args.multi_fidelity)
     elif args.mode == 'custom':
-        run_custom_experiment()
+        run_custom_experiment(args.jobs, args.batch, args.prime_sets,
+                              args.multi_fidelity)
 
 
 if __name__ == "__main__":
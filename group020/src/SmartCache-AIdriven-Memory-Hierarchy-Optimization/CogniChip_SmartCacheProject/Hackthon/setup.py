@@ -0,0 +1,28 @@
+"""
+Build script for the optional native cache simulator extension.
+
+Usage:
+    pip install pybind11
+    python setup.py build_ext --inplace
+
+Then run with CACHE_SIM_NATIVE=1 to make CacheSimulator.run_trace use
+the extension for ndarray traces.
+"""
+
+from pybind11.setup_helpers import Pybind11Extension, build_ext
+from setuptools import setup
+
+ext_modules = [
+    Pybind11Extension(
+        "_cache_sim_ext",
+        ["_cache_sim_ext.cpp"],
+        cxx_std=17,
+        extra_compile_args=["-O3", "-march=native", "-funroll-loops"],
+    ),
+]
+
+setup(
+    name="smartcache-native",
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": build_ext},
+)
@@ -0,0 +1,216 @@
+"""
+Tests for the replay kernels and the Bayesian optimizer.
+
+Run with:  python -m pytest -q
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from ai_optimizer import BayesianCacheOptimizer
+from cache_simulator import CacheSimulator, evaluate_cache_config
+from cache_simulator_numba import (eval_miss_rate, evaluate_cache_configs_batch,
+                                   get_trace_kernel, run_trace_kernel,
+                                   run_trace_kernel_mod)
+from experiment_framework import (_WorkloadObjective, _miss_rates,
+                                  _register_trace, _unregister_trace)
+from trace_generator import TraceGenerator
+
+
+# (cache_size, block_size, associativity): every specialized associativity,
+# the generic kernel (assoc 3 and 32) and set counts that are not a power
+# of two (modulo kernel)
+CONFIGS = [
+    (4096, 32, 1),
+    (8192, 64, 2),
+    (16384, 64, 4),
+    (32768, 64, 8),
+    (65536, 128, 16),
+    (8192, 16, 32),
+    (3 * 64 * 16, 64, 3),
+    (12288, 64, 4),
+    (7 * 32 * 2, 32, 2),
+]
+
+
+def _trace(dtype, n=5000, seed=0):
+    """Mix of streaming and random accesses over a 64 KB footprint."""
+    rng = np.random.default_rng(seed)
+    addresses = np.concatenate([np.arange(0, n // 2 * 8, 8),
+                                rng.integers(0, 1 << 16, n - n // 2)])
+    return addresses.astype(dtype)
+
+
+def _reference(config, trace):
+    """Replay trace one access() call at a time (the Python path)."""
+    simulator = CacheSimulator(*config)
+    for address in trace.tolist():
+        simulator.access(address)
+    return simulator
+
+
+@pytest.mark.parametrize('dtype', [np.uint32, np.int64])
+@pytest.mark.parametrize('config', CONFIGS)
+def test_kernel_matches_access(config, dtype):
+    trace = _trace(dtype)
+    expected = _reference(config, trace)
+
+    simulator = CacheSimulator(*config)
+    kernel = get_trace_kernel(simulator.associativity, simulator.num_sets)
+    hits, tick = kernel(trace, simulator._tags, simulator._age, 0,
+                        simulator.offset_bits, simulator.index_bits)
+
+    assert hits == expected.hits
+    assert tick == expected._tick
+    np.testing.assert_array_equal(simulator._tags, expected._tags)
+    if simulator.associativity > 1:
+        np.testing.assert_array_equal(simulator._age, expected._age)
+    assert eval_miss_rate(trace, *config) == pytest.approx(
+        expected.misses / trace.size)
+
+
+@pytest.mark.parametrize('config', [c for c in CONFIGS if c[2] > 1])
+def test_generic_kernels_match_access(config):
+    trace = _trace(np.int64, seed=1)
+    expected = _reference(config, trace)
+
+    simulator = CacheSimulator(*config)
+    kernel = run_trace_kernel if simulator._pow2_sets else run_trace_kernel_mod
+    hits, _ = kernel(trace, simulator._tags, simulator._age, 0,
+                     simulator.offset_bits, simulator.index_bits)
+
+    assert hits == expected.hits
+    np.testing.assert_array_equal(simulator._tags, expected._tags)
+    np.testing.assert_array_equal(simulator._age, expected._age)
+
+
+@pytest.mark.parametrize('dtype', [np.uint32, np.int64])
+def test_batch_matches_access(dtype):
+    trace = _trace(dtype, seed=2)
+    # Includes an invalid configuration (smaller than one set)
+    configs = CONFIGS + [(64, 64, 2)]
+    cache_sizes, block_sizes, associativities = zip(*configs)
+
+    miss_rates = evaluate_cache_configs_batch(cache_sizes, block_sizes,
+                                              associativities, trace)
+
+    expected = [_reference(config, trace).misses / trace.size
+                for config in CONFIGS] + [1.0]
+    np.testing.assert_allclose(miss_rates, expected, rtol=0, atol=1e-12)
+
+
+def test_reused_simulators_are_thread_safe():
+    traces = [_trace(np.int64, seed=seed) for seed in range(4)]
+    expected = [[_reference(config, trace).misses / trace.size
+                 for config in CONFIGS] for trace in traces]
+
+    def evaluate(trace):
+        return [evaluate_cache_config(*config, trace) for config in CONFIGS]
+
+    # Every thread replays every trace on the same configurations, so
+    # simulators are reused across traces within each thread
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(evaluate, traces * 4))
+    assert results == expected * 4
+
+
+def test_objective_batch_shares_the_evaluation_memo():
+    trace = _trace(np.uint32, seed=3)
+    trace_key = _register_trace(trace)
+    try:
+        objective = _WorkloadObjective(trace, trace_key)
+        first = objective(*CONFIGS[0])
+        memo = _miss_rates[trace_key]
+        # A memoized miss rate is answered without simulating
+        memo[CONFIGS[1]] = 0.5
+
+        miss_rates = objective.evaluate_batch(CONFIGS[:3])
+
+        assert miss_rates[:2] == [first, 0.5]
+        assert miss_rates[2] == pytest.approx(
+            _reference(CONFIGS[2], trace).misses / trace.size)
+        assert memo[CONFIGS[2]] == miss_rates[2]
+    finally:
+        _unregister_trace(trace_key)
+    assert trace_key not in _miss_rates
+
+
+def _objective(cache_size, block_size, associativity):
+    """Smooth synthetic miss rate, lowest for large, associative caches."""
+    return (1024.0 / cache_size + abs(np.log2(block_size) - 6) / 50
+            + 0.1 / associativity)
+
+
+def _low_fidelity_objective(cache_size, block_size, associativity):
+    """Cheap objective that would win every comparison if it leaked."""
+    return 0.0
+
+
+def test_multi_fidelity_keeps_low_fidelity_out_of_priors():
+    optimizer = BayesianCacheOptimizer(n_calls=12, verbose=False)
+    result = optimizer.optimize(_objective,
+                                low_fidelity_objective=_low_fidelity_objective)
+
+    assert result['best_miss_rate'] > 0.0
+    assert result['best_miss_rate'] == _objective(
+        result['best_config']['cache_size'],
+        result['best_config']['block_size'],
+        result['best_config']['associativity'])
+    # Only full-fidelity evaluations reach the result and the priors
+    assert 0.0 not in optimizer._prior_y
+    assert 0.0 not in result['skopt_result'].func_vals
+    assert len(optimizer._prior_y) == len(result['skopt_result'].func_vals)
+    assert all(entry['fidelity'] == 'full'
+               for entry in optimizer.get_pareto_frontier())
+
+
+def test_warm_start_reports_only_the_current_call():
+    optimizer = BayesianCacheOptimizer(n_calls=12, verbose=False)
+    optimizer.optimize(_objective)
+    first_X = optimizer._prior_X
+    assert len(first_X) == 12
+
+    result = optimizer.optimize(_objective)
+
+    # The priors seed the GP but are not reported again
+    assert len(result['skopt_result'].func_vals) == 12
+    assert len(result['skopt_result'].x_iters) == 12
+    # The next warm start sees this call's observations only
+    assert len(optimizer._prior_X) == 12
+    assert optimizer._prior_X is not first_X
+
+
+@pytest.mark.parametrize('options', [{'batch_size': 0}, {'n_jobs': 0}])
+def test_optimize_rejects_non_positive_counts(options):
+    optimizer = BayesianCacheOptimizer(n_calls=12, verbose=False)
+    with pytest.raises(ValueError):
+        optimizer.optimize(_objective, **options)
+
+
+def test_prime_sets_respect_size_limits():
+    optimizer = BayesianCacheOptimizer(max_cache_size=32768,
+                                       min_cache_size=1024,
+                                       prime_sets=True, verbose=False)
+
+    for cache_size, block_size, associativity in \
+            optimizer._valid_configs.values():
+        num_sets = cache_size // (block_size * associativity)
+        assert 1024 <= cache_size <= 32768
+        assert num_sets == 1 or all(num_sets % d
+                                    for d in range(2, num_sets))
+
+
+def test_memoized_traces_are_read_only_views():
+    generator = TraceGenerator(seed=0)
+    first = generator.sequential_scan_trace(100)
+    second = generator.sequential_scan_trace(100)
+
+    assert np.shares_memory(first, second)
+    with pytest.raises(ValueError):
+        first[0] = 1
+    with pytest.raises(ValueError):
+        first.flags.writeable = True
+    suite = generator.get_workload_suite()
+    assert all(not trace.flags.writeable for trace in suite.values())
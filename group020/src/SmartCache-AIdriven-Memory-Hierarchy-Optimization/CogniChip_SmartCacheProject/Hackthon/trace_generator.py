@@ -10,9 +10,160 @@ Generates realistic memory access patterns for:
 These traces simulate real application behavior for cache evaluation.
 """
 
+import functools
+import inspect
+
 import numpy as np
-from typing import List, Tuple
-import random
+from typing import Callable, Iterator, Tuple
+
+from cache_simulator_numba import NUMBA_AVAILABLE, njit, prange
+
+# Every generated address fits in 32 bits; uint32 traces take half the
+# memory (and memory bandwidth during simulation) of int64 ones
+_ADDRESS_DTYPE = np.uint32
+
+
+def _check_address_range(base_addr: int, num_elements: int,
+                         element_size: int = 4):
+    """Raise ValueError if an array's addresses do not fit in _ADDRESS_DTYPE."""
+    last_addr = base_addr + max(num_elements - 1, 0) * element_size
+    if base_addr < 0 or last_addr > np.iinfo(_ADDRESS_DTYPE).max:
+        raise ValueError(f"addresses up to {last_addr:#x} do not fit in "
+                         f"{np.dtype(_ADDRESS_DTYPE).name}")
+
+
+@njit(parallel=True, cache=True)
+def _matmul_trace(N, base_addr, out):
+    """
+    Write the i-j-k matrix multiplication trace into out.
+
+    out must hold exactly N * N * (1 + 3 * N) elements. Each i row
+    fills its own contiguous slice of out, so the rows run in parallel.
+    """
+    element_size = 4
+    # Address tables for A, B and C, stored consecutively from base_addr
+    A_tbl = base_addr + np.arange(N * N, dtype=np.int64) * element_size
+    B_tbl = A_tbl + N * N * element_size
+    C_tbl = B_tbl + N * N * element_size
+    row_len = N * (1 + 3 * N)
+
+    for i in prange(N):
+        pos = i * row_len
+        for j in range(N):
+            c_addr = C_tbl[i * N + j]
+            out[pos] = c_addr
+            pos += 1
+            for k in range(N):
+                out[pos] = A_tbl[i * N + k]
+                out[pos + 1] = B_tbl[k * N + j]
+                out[pos + 2] = c_addr
+                pos += 3
+
+
+@njit(nogil=True, cache=True)
+def _quicksort_partitions(array_size):
+    """
+    (low, high) bounds of every non-trivial quicksort partition, in the
+    order TraceGenerator.quicksort_trace emits them.
+
+    The bounds do not depend on the random pivot draws, so they are
+    computed up front with an explicit array-backed stack.
+    """
+    n_max = max(array_size, 1)
+    lows = np.empty(n_max, dtype=np.int64)
+    highs = np.empty(n_max, dtype=np.int64)
+    stack = np.empty(2 * (array_size + 1), dtype=np.int64)
+    n = 0
+    stack[0] = 0
+    stack[1] = array_size - 1
+    sp = 2
+    while sp > 0:
+        sp -= 2
+        low = stack[sp]
+        high = stack[sp + 1]
+        if low >= high:
+            continue
+        lows[n] = low
+        highs[n] = high
+        n += 1
+        # Right half is pushed first so the left half is emitted next
+        pivot_pos = low + (high - low) // 2
+        stack[sp] = pivot_pos + 1
+        stack[sp + 1] = high
+        stack[sp + 2] = low
+        stack[sp + 3] = pivot_pos - 1
+        sp += 4
+    return lows[:n], highs[:n]
+
+
+@njit(nogil=True, cache=True)
+def _quicksort_trace(lows, highs, pivots, swaps, base_addr):
+    """
+    Emit the quicksort trace for pre-drawn pivots and swap decisions.
+
+    For partition p: the pivot access, then one compare per element of
+    [lows[p], highs[p]], each followed by a write back where the next
+    entry of swaps is set. The output is sized exactly from the inputs.
+    """
+    element_size = 4
+    out = np.empty(lows.size + swaps.size + np.count_nonzero(swaps),
+                   dtype=_ADDRESS_DTYPE)
+    pos = 0
+    s = 0
+    for p in range(lows.size):
+        out[pos] = base_addr + pivots[p] * element_size
+        pos += 1
+        for i in range(lows[p], highs[p] + 1):
+            addr = base_addr + i * element_size
+            out[pos] = addr  # Compare with pivot
+            pos += 1
+            if swaps[s]:
+                out[pos] = addr  # Write back
+                pos += 1
+            s += 1
+    return out
+
+
+def _matmul_tables(N: int, base_addr: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Address tables for A, B and C stored consecutively from base_addr,
+    each viewed as N x N so that A_tbl[i][k] is &A[i][k].
+    """
+    element_size = 4  # 4 bytes per element (float32)
+    A_tbl = (base_addr + np.arange(N * N, dtype=_ADDRESS_DTYPE) * element_size).reshape(N, N)
+    B_tbl = A_tbl + N * N * element_size
+    C_tbl = B_tbl + N * N * element_size
+    return A_tbl, B_tbl, C_tbl
+
+
+def _fill_matmul_tile(tile: np.ndarray, i: int, A_tbl: np.ndarray,
+                      B_tbl: np.ndarray, C_tbl: np.ndarray):
+    """
+    Write the accesses of outer iteration i into an (N, 1 + 3N) tile:
+    tile[j] = [C[i][j], (A[i][k], B[k][j], C[i][j]) for each k].
+    """
+    tile[:, 0] = C_tbl[i]
+    tile[:, 1::3] = A_tbl[i]
+    tile[:, 2::3] = B_tbl.T  # B[k][j] - Poor spatial locality!
+    tile[:, 3::3] = C_tbl[i][:, None]
+
+
+def _deterministic_trace(method):
+    """
+    Memoize a trace method whose output depends only on its arguments
+    (not on the generator's random state), via _memoized.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = list(bound.arguments.values())[1:]
+        cache_key = '_'.join([method.__name__] + [str(p) for p in params])
+        return self._memoized(cache_key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
 
 
 class TraceGenerator:
@@ -24,18 +175,43 @@ class TraceGenerator:
     """
     
     def __init__(self, seed: int = 42):
-        """Initialize with random seed for reproducibility."""
+        """
+        Initialize with random seed for reproducibility.
+        
+        Deterministic traces (matrix multiplication, sequential and
+        strided scans) are memoized per generator.
+        """
         self.seed = seed
-        np.random.seed(seed)
-        random.seed(seed)
+        # All random traces draw from this generator only; the global
+        # np.random state is left untouched
+        self.rng = np.random.default_rng(seed)
+        self._trace_cache = {}
+        self._suite = None
+    
+    def _memoized(self, cache_key: str,
+                  fn: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Return the trace for cache_key, computing it with fn() only once.
+        
+        The memoized array is read-only and callers get a read-only view
+        of it, so no copy is made and a returned trace cannot be modified
+        to corrupt the cache.
+        """
+        trace = self._trace_cache.get(cache_key)
+        if trace is None:
+            trace = fn()
+            trace.flags.writeable = False
+            self._trace_cache[cache_key] = trace
+        return trace.view()
     
     @staticmethod
     def _align_address(address: int, alignment: int = 4) -> int:
         """Align address to specified byte boundary."""
         return (address // alignment) * alignment
     
+    @_deterministic_trace
     def matrix_multiplication_trace(self, matrix_size: int, 
-                                    base_addr: int = 0x10000) -> List[int]:
+                                    base_addr: int = 0x10000) -> np.ndarray:
         """
         Generate trace for Matrix Multiplication (A * B = C).
         
@@ -59,41 +235,63 @@ class TraceGenerator:
             
         Returns:
         --------
-        trace : List[int]
+        trace : np.ndarray (uint32)
             Sequence of memory addresses accessed
         """
         N = matrix_size
-        element_size = 4  # 4 bytes per element (float32)
+        _check_address_range(base_addr, 3 * N * N)
         
-        # Memory layout: A, B, C stored consecutively
-        A_base = base_addr
-        B_base = A_base + N * N * element_size
-        C_base = B_base + N * N * element_size
+        # Exact length: one C write per (i, j) plus an A, B, C triple per k
+        trace = np.empty(N * N * (1 + 3 * N), dtype=_ADDRESS_DTYPE)
         
-        trace = []
+        if NUMBA_AVAILABLE:
+            _matmul_trace(N, base_addr, trace)
+            return trace
+        
+        # Memory layout: A, B, C stored consecutively
+        tables = _matmul_tables(N, base_addr)
         
+        # Fill one i tile at a time so temporaries stay O(N^2)
+        tiles = trace.reshape(N, N, 1 + 3 * N)
         for i in range(N):
-            for j in range(N):
-                # Access C[i][j] for initialization (write)
-                c_addr = C_base + (i * N + j) * element_size
-                trace.append(c_addr)
-                
-                for k in range(N):
-                    # Read A[i][k]
-                    a_addr = A_base + (i * N + k) * element_size
-                    trace.append(a_addr)
-                    
-                    # Read B[k][j] - Poor spatial locality!
-                    b_addr = B_base + (k * N + j) * element_size
-                    trace.append(b_addr)
-                    
-                    # Read-Modify-Write C[i][j]
-                    trace.append(c_addr)
+            _fill_matmul_tile(tiles[i], i, *tables)
         
         return trace
     
+    def matrix_multiplication_iter(self, matrix_size: int,
+                                   base_addr: int = 0x10000) -> Iterator[np.ndarray]:
+        """
+        Stream the matrix multiplication trace one outer (i) iteration at a time.
+        
+        Yields the same addresses, in the same order, as
+        matrix_multiplication_trace, but only holds O(N^2) addresses at
+        once, so traces too large to materialize (N >= 256) can still be
+        simulated by feeding each chunk to CacheSimulator.run_trace, which
+        keeps its state between calls.
+        
+        Parameters:
+        -----------
+        matrix_size : int
+            Dimension N of NxN matrices
+        base_addr : int
+            Base memory address
+            
+        Yields:
+        -------
+        chunk : np.ndarray (uint32)
+            The N * (1 + 3N) addresses accessed for one row i of C
+        """
+        N = matrix_size
+        _check_address_range(base_addr, 3 * N * N)
+        tables = _matmul_tables(N, base_addr)
+        
+        for i in range(N):
+            tile = np.empty((N, 1 + 3 * N), dtype=_ADDRESS_DTYPE)
+            _fill_matmul_tile(tile, i, *tables)
+            yield tile.ravel()
+    
     def quicksort_trace(self, array_size: int, 
-                       base_addr: int = 0x20000) -> List[int]:
+                       base_addr: int = 0x20000) -> np.ndarray:
         """
         Generate trace for QuickSort algorithm.
         
@@ -111,45 +309,41 @@ class TraceGenerator:
             
         Returns:
         --------
-        trace : List[int]
+        trace : np.ndarray (uint32)
             Sequence of memory addresses accessed
         """
+        _check_address_range(base_addr, array_size)
+        
+        # Partition bounds are fixed by array_size; only the pivots and
+        # the ~30% swap decisions are random. Both are drawn from self.rng
+        # up front, so the trace is the same with or without Numba.
+        lows, highs = _quicksort_partitions(array_size)
+        pivots = self.rng.integers(lows, highs + 1)
+        swaps = self.rng.random(int((highs - lows + 1).sum())) < 0.3
+        
+        if NUMBA_AVAILABLE:
+            return _quicksort_trace(lows, highs, pivots, swaps, base_addr)
+        
+        # Vectorized equivalent of the kernel: per partition, the pivot
+        # followed by its scanned elements, swapped ones repeated once
         element_size = 4
-        trace = []
-        
-        # Create array with random values for realistic partitioning
-        arr = list(range(array_size))
-        random.shuffle(arr)
-        
-        def quicksort_trace_helper(low: int, high: int):
-            if low < high:
-                # Partition phase - many comparisons and swaps
-                pivot_idx = random.randint(low, high)
-                
-                # Access pivot
-                pivot_addr = base_addr + pivot_idx * element_size
-                trace.append(pivot_addr)
-                
-                # Scan through array for partitioning
-                for i in range(low, high + 1):
-                    addr = base_addr + i * element_size
-                    trace.append(addr)  # Compare with pivot
-                    
-                    # Simulate swaps (multiple accesses)
-                    if random.random() < 0.3:  # ~30% swap rate
-                        trace.append(addr)  # Write back
-                
-                # Recursive calls
-                pivot_pos = low + (high - low) // 2
-                quicksort_trace_helper(low, pivot_pos - 1)
-                quicksort_trace_helper(pivot_pos + 1, high)
-        
-        quicksort_trace_helper(0, array_size - 1)
-        return trace
+        lengths = highs - lows + 1
+        is_pivot = np.zeros(lows.size + lengths.sum(), dtype=bool)
+        is_pivot[np.cumsum(1 + lengths) - (1 + lengths)] = True
+        offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        
+        indices = np.empty(is_pivot.size, dtype=np.int64)
+        indices[is_pivot] = pivots
+        indices[~is_pivot] = np.repeat(lows, lengths) + offsets
+        repeats = np.ones(is_pivot.size, dtype=np.int64)
+        repeats[~is_pivot] += swaps
+        
+        return (base_addr + np.repeat(indices, repeats) * element_size).astype(_ADDRESS_DTYPE)
     
+    @_deterministic_trace
     def sequential_scan_trace(self, array_size: int, 
                              stride: int = 1,
-                             base_addr: int = 0x30000) -> List[int]:
+                             base_addr: int = 0x30000) -> np.ndarray:
         """
         Generate trace for sequential array access.
         
@@ -168,21 +362,16 @@ class TraceGenerator:
             
         Returns:
         --------
-        trace : List[int]
+        trace : np.ndarray (uint32)
             Sequence of memory addresses accessed
         """
         element_size = 4
-        trace = []
-        
-        for i in range(0, array_size, stride):
-            addr = base_addr + i * element_size
-            trace.append(addr)
-        
-        return trace
+        _check_address_range(base_addr, array_size)
+        return base_addr + np.arange(0, array_size, stride, dtype=_ADDRESS_DTYPE) * element_size
     
     def random_access_trace(self, array_size: int, 
                            num_accesses: int,
-                           base_addr: int = 0x40000) -> List[int]:
+                           base_addr: int = 0x40000) -> np.ndarray:
         """
         Generate trace for random memory accesses.
         
@@ -201,23 +390,19 @@ class TraceGenerator:
             
         Returns:
         --------
-        trace : List[int]
+        trace : np.ndarray (uint32)
             Sequence of memory addresses accessed
         """
         element_size = 4
-        trace = []
-        
-        for _ in range(num_accesses):
-            idx = random.randint(0, array_size - 1)
-            addr = base_addr + idx * element_size
-            trace.append(addr)
-        
-        return trace
+        _check_address_range(base_addr, array_size)
+        idx = self.rng.integers(0, array_size, size=num_accesses, dtype=_ADDRESS_DTYPE)
+        return base_addr + idx * element_size
     
+    @_deterministic_trace
     def strided_access_trace(self, array_size: int, 
                             stride: int,
                             num_passes: int = 1,
-                            base_addr: int = 0x50000) -> List[int]:
+                            base_addr: int = 0x50000) -> np.ndarray:
         """
         Generate trace for strided array access.
         
@@ -239,20 +424,15 @@ class TraceGenerator:
             
         Returns:
         --------
-        trace : List[int]
+        trace : np.ndarray (uint32)
             Sequence of memory addresses accessed
         """
         element_size = 4
-        trace = []
-        
-        for _ in range(num_passes):
-            for i in range(0, array_size, stride):
-                addr = base_addr + i * element_size
-                trace.append(addr)
-        
-        return trace
+        _check_address_range(base_addr, array_size)
+        pass_addrs = base_addr + np.arange(0, array_size, stride, dtype=_ADDRESS_DTYPE) * element_size
+        return np.tile(pass_addrs, num_passes)
     
-    def mixed_workload_trace(self, size: int = 1000) -> List[int]:
+    def mixed_workload_trace(self, size: int = 1000) -> np.ndarray:
         """
         Generate a realistic mixed workload combining multiple patterns.
         
@@ -269,30 +449,30 @@ class TraceGenerator:
             
         Returns:
         --------
-        trace : List[int]
+        trace : np.ndarray (uint32)
             Sequence of memory addresses accessed
         """
-        trace = []
-        
         # Sequential portion (40%)
         seq_size = int(size * 0.4)
-        trace.extend(self.sequential_scan_trace(seq_size, base_addr=0x10000))
+        sequential = self.sequential_scan_trace(seq_size, base_addr=0x10000)
         
         # Strided portion (30%)
         stride_size = int(size * 0.3)
-        trace.extend(self.strided_access_trace(stride_size, stride=8, base_addr=0x20000))
+        strided = self.strided_access_trace(stride_size, stride=8, base_addr=0x20000)
         
         # Random portion (20%)
         random_size = int(size * 0.2)
-        trace.extend(self.random_access_trace(1000, random_size, base_addr=0x30000))
+        rand = self.random_access_trace(1000, random_size, base_addr=0x30000)
         
         # Hotspot portion (10%) - repeatedly access small region
         hotspot_size = int(size * 0.1)
         hotspot_region = 100
-        trace.extend(self.random_access_trace(hotspot_region, hotspot_size, base_addr=0x40000))
+        hotspot = self.random_access_trace(hotspot_region, hotspot_size, base_addr=0x40000)
+        
+        trace = np.concatenate([sequential, strided, rand, hotspot])
         
-        # Shuffle to mix patterns
-        random.shuffle(trace)
+        # Shuffle to mix patterns (in place, PCG64)
+        self.rng.shuffle(trace)
         
         return trace
     
@@ -300,11 +480,22 @@ class TraceGenerator:
         """
         Get a comprehensive suite of workloads for evaluation.
         
+        The suite is generated once per generator; every call returns
+        read-only views of the same traces.
+        
         Returns:
         --------
         workloads : dict
             Dictionary mapping workload names to traces
         """
+        if self._suite is None:
+            self._suite = self._build_workload_suite()
+            for trace in self._suite.values():
+                trace.flags.writeable = False
+        return {name: trace.view() for name, trace in self._suite.items()}
+    
+    def _build_workload_suite(self) -> dict:
+        """Generate every trace of the workload suite."""
         return {
             'matmul_small': self.matrix_multiplication_trace(32),
             'matmul_medium': self.matrix_multiplication_trace(64),
@@ -8,15 +8,161 @@ Generate plots and visualizations for cache optimization results:
 - Heatmaps of design space exploration
 """
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
 import matplotlib.pyplot as plt
+from cycler import cycler
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
-import seaborn as sns
+from ai_optimizer import pareto_front_indices
 
-# Set nice styling
+# Optional fast JSON parser for loading results (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional streaming JSON parser, so large results files are read one
+# workload at a time instead of being loaded whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Seaborn's default 6-color "husl" palette, hard-coded so that seaborn
+# (and the pandas/scipy stack it imports) is not needed
+_HUSL6 = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+# Set nice styling (the style sheet ships with matplotlib)
 plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = cycler(color=_HUSL6)
+
+# Structured (SoA) view of evaluated configurations: one column per field
+_HISTORY_DTYPE = np.dtype([('size', 'i8'), ('mr', 'f8'), ('assoc', 'i4')])
+
+# Evaluations drawn by plot_design_space_exploration; longer histories
+# are thinned evenly by iteration (the best point is always kept)
+_MAX_SCATTER_POINTS = 2000
+
+# Histories whose convergence curves are kept for incremental replotting
+_CONV_CACHE_SIZE = 8
+
+# Fast, lightly compressed PNG encoding for saved figures
+_PNG_PIL_KWARGS = {'optimize': False, 'compress_level': 1}
+
+# Annotation styles, shared by reference (matplotlib copies them per artist)
+_PARETO_LABEL_BBOX = dict(boxstyle='round,pad=0.3', facecolor='yellow',
+                          alpha=0.3)
+_BEST_LABEL_BBOX = dict(boxstyle='round,pad=0.5', facecolor='yellow',
+                        alpha=0.7)
+_BEST_LABEL_ARROW = dict(arrowstyle='->', connectionstyle='arc3,rad=0')
+_NOTE_BBOX = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
+
+
+def _history_to_soa(history: List[Dict]) -> np.ndarray:
+    """
+    Extract cache size, miss rate and associativity from a list of result
+    dicts in a single pass.
+    
+    Parameters:
+    -----------
+    history : List[Dict]
+        Evaluated configurations (optimization history or Pareto points)
+        
+    Returns:
+    --------
+    np.ndarray
+        Structured array with fields 'size' (bytes), 'mr' (fraction) and
+        'assoc'; scale columns with vectorized ops, e.g. recs['size'] / 1024
+    """
+    return np.array([(h['cache_size'], h['miss_rate'], h['associativity'])
+                     for h in history], dtype=_HISTORY_DTYPE)
+
+
+def _iter_optimized_results(results_file: str) -> Iterator[Tuple[str, Dict]]:
+    """
+    Yield (workload_name, result) pairs from the 'optimized' section of a
+    saved results file.
+    
+    With ijson the section is streamed, so only one workload's result
+    (including its full optimization history) is in memory at a time.
+    """
+    if ijson is not None:
+        with open(results_file, 'rb') as f:
+            yield from ijson.kvitems(f, 'optimized', use_float=True)
+        return
+    
+    if orjson is not None:
+        with open(results_file, 'rb') as f:
+            results = orjson.loads(f.read())
+    else:
+        with open(results_file, 'r') as f:
+            results = json.load(f)
+    yield from results['optimized'].items()
+
+
+# Per-process Axes reused by _render_pareto_task, keyed by (figsize, dpi)
+_worker_axes = {}
+
+
+def _render_pareto_task(figsize: tuple, dpi: int, pareto_points: List[Dict],
+                        title: str, save_path: str) -> str:
+    """
+    Worker-process entry point for create_summary_report: render and save
+    one Pareto frontier figure off-screen, reusing the worker's figure.
+    """
+    ax = _worker_axes.get((figsize, dpi))
+    if ax is None:
+        matplotlib.use('Agg')
+        _, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        _worker_axes[(figsize, dpi)] = ax
+    SmartCacheVisualizer(figsize, dpi).plot_pareto_frontier(
+        pareto_points, title=title, save_path=save_path, show=False, ax=ax)
+    return save_path
+
+
+class _LivePareto:
+    """
+    Pareto frontier artists that are updated in place for interactive
+    re-plotting (see SmartCacheVisualizer.live_pareto_frontier).
+    
+    update() swaps the data of the existing line and marker collection and
+    schedules a redraw, instead of rebuilding the axes on every refresh.
+    """
+    
+    def __init__(self, ax, color: str = '#2E86AB'):
+        self.ax = ax
+        self.line, = ax.plot([], [], '-', linewidth=2, color=color)
+        self.sc = ax.scatter([], [], s=64, color=color,
+                             zorder=self.line.get_zorder() + 1)
+    
+    def update(self, sizes, miss_rates):
+        """
+        Show a new frontier.
+        
+        Parameters:
+        -----------
+        sizes : array-like
+            Cache sizes (KB) of the frontier points
+        miss_rates : array-like
+            Miss rates (%) of the frontier points
+        """
+        self.line.set_data(sizes, miss_rates)
+        self.sc.set_offsets(np.column_stack([sizes, miss_rates]))
+        # Limits follow the line; the markers share its points
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.figure.canvas.draw_idle()
+    
+    def update_points(self, pareto_points: List[Dict]):
+        """Show a new frontier given as configuration dicts."""
+        recs = _history_to_soa(SmartCacheVisualizer._kung_2d(pareto_points))
+        self.update(recs['size'] / 1024, recs['mr'] * 100)
 
 
 class SmartCacheVisualizer:
@@ -43,10 +189,106 @@ class SmartCacheVisualizer:
         """
         self.figsize = figsize
         self.dpi = dpi
+        # id(history) -> (history, miss_rates, best_so_far). Entries hold a
+        # reference to the history, so an id()-based key stays unique.
+        self._conv_cache = {}
+    
+    def _convergence_arrays(self, history: List[Dict]
+                            ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Miss rates (%) and their running minimum for a history.
+        
+        Histories are assumed to be append-only (e.g. a live optimization
+        run being re-plotted): when the same list is seen again, only the
+        entries added since the last call are extracted and folded into the
+        cached running minimum.
+        
+        Parameters:
+        -----------
+        history : List[Dict]
+            Non-empty history of evaluated configurations
+            
+        Returns:
+        --------
+        tuple
+            (miss_rates, best_so_far) arrays, in percent
+        """
+        entry = self._conv_cache.pop(id(history), None)
+        if (entry is not None and entry[0] is history
+                and len(entry[1]) <= len(history)):
+            _, miss_rates, best_so_far = entry
+            tail = _history_to_soa(history[len(miss_rates):])['mr'] * 100
+            if len(tail):
+                miss_rates = np.concatenate((miss_rates, tail))
+                tail_best = np.minimum.accumulate(
+                    np.concatenate(([best_so_far[-1]], tail)))[1:]
+                best_so_far = np.concatenate((best_so_far, tail_best))
+        else:
+            miss_rates = _history_to_soa(history)['mr'] * 100
+            best_so_far = np.minimum.accumulate(miss_rates)
+        
+        # Re-insert as most recent; evict the least recently used history
+        self._conv_cache[id(history)] = (history, miss_rates, best_so_far)
+        if len(self._conv_cache) > _CONV_CACHE_SIZE:
+            del self._conv_cache[next(iter(self._conv_cache))]
+        return miss_rates, best_so_far
+    
+    @staticmethod
+    def _figure_axes(ax, figsize: tuple, dpi: int):
+        """
+        Resolve the Axes to draw into.
+        
+        Returns (fig, ax, owned). A caller-supplied Axes is cleared and
+        reused; otherwise a new figure is created, which the plotter then
+        owns and closes when done.
+        """
+        if ax is None:
+            fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+            return fig, ax, True
+        ax.cla()
+        return ax.figure, ax, False
+    
+    def _savefig(self, fig, save_path: str):
+        """
+        Save a figure at the visualizer's resolution.
+        
+        PNGs are written with zlib level 1 instead of the default 6, which
+        cuts encode time several-fold for a slightly larger file. The option
+        only exists for Pillow-backed formats, so other formats (PDF, SVG)
+        are saved with the defaults.
+        """
+        kwargs = {}
+        if save_path.lower().endswith('.png'):
+            kwargs['pil_kwargs'] = _PNG_PIL_KWARGS
+        fig.savefig(save_path, dpi=self.dpi, bbox_inches='tight', **kwargs)
+    
+    @staticmethod
+    def _kung_2d(points: List[Dict]) -> List[Dict]:
+        """
+        Filter configurations down to the (cache size, miss rate) Pareto
+        frontier with pareto_front_indices, the filter behind
+        BayesianCacheOptimizer.get_pareto_frontier, so an existing
+        frontier passes through unchanged.
+        
+        Parameters:
+        -----------
+        points : List[Dict]
+            Candidate configurations
+            
+        Returns:
+        --------
+        List[Dict]
+            Pareto-optimal configurations sorted by cache size
+        """
+        recs = _history_to_soa(points)
+        return [points[i]
+                for i in pareto_front_indices(recs['size'], recs['mr'])]
     
     def plot_pareto_frontier(self, pareto_points: List[Dict],
                             title: str = "Pareto Frontier: Size vs. Miss Rate",
-                            save_path: Optional[str] = None):
+                            save_path: Optional[str] = None,
+                            show: bool = True,
+                            ax=None):
         """
         Plot Pareto frontier showing trade-off between cache size and miss rate.
         
@@ -64,48 +306,103 @@ class SmartCacheVisualizer:
             Plot title
         save_path : str, optional
             Path to save figure
+        show : bool
+            Display the figure; figures created here are closed afterwards
+            either way
+        ax : matplotlib.axes.Axes, optional
+            Existing Axes to clear and draw into instead of creating a new
+            figure (e.g. to reuse one figure across many plots); the caller
+            keeps ownership of its figure
         """
         if not pareto_points:
             print("WARNING: No Pareto points to plot")
             return
         
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        # Drop any dominated points so the curve is a proper frontier
+        pareto_points = self._kung_2d(pareto_points)
         
-        # Extract data
-        sizes = [p['cache_size'] / 1024 for p in pareto_points]  # Convert to KB
-        miss_rates = [p['miss_rate'] * 100 for p in pareto_points]  # Convert to %
+        fig, ax, owned = self._figure_axes(ax, self.figsize, self.dpi)
         
-        # Plot Pareto curve
-        ax.plot(sizes, miss_rates, 'o-', linewidth=2, markersize=8,
-               label='Pareto Frontier', color='#2E86AB')
+        # Extract data
+        recs = _history_to_soa(pareto_points)
+        sizes = recs['size'] / 1024  # Convert to KB
+        miss_rates = recs['mr'] * 100  # Convert to %
+        assocs = recs['assoc']
+        
+        # Plot Pareto curve: one line plus one marker collection on top
+        line, = ax.plot(sizes, miss_rates, '-', linewidth=2, color='#2E86AB')
+        ax.scatter(sizes, miss_rates, s=64, color='#2E86AB',
+                  zorder=line.get_zorder() + 1)
+        handle = Line2D([], [], marker='o', linewidth=2, markersize=8,
+                        color='#2E86AB', label='Pareto Frontier')
         
         # Annotate points
-        for i, (s, m, p) in enumerate(zip(sizes, miss_rates, pareto_points)):
-            if i % max(1, len(pareto_points) // 5) == 0:  # Annotate every ~5th point
-                ax.annotate(f"{int(s)}KB\n{p['associativity']}-way",
-                          xy=(s, m), xytext=(10, -10),
-                          textcoords='offset points',
-                          fontsize=8, alpha=0.7,
-                          bbox=dict(boxstyle='round,pad=0.3', 
-                                   facecolor='yellow', alpha=0.3))
+        stride = max(1, len(sizes) // 5)  # Annotate every ~5th point
+        idxs = np.arange(0, len(sizes), stride)
+        for s, m, a in zip(sizes[idxs], miss_rates[idxs], assocs[idxs]):
+            ax.annotate(f"{int(s)}KB\n{a}-way",
+                      xy=(s, m), xytext=(10, -10),
+                      textcoords='offset points',
+                      fontsize=8, alpha=0.7,
+                      bbox=_PARETO_LABEL_BBOX)
         
         ax.set_xlabel('Cache Size (KB)', fontsize=12, fontweight='bold')
         ax.set_ylabel('Miss Rate (%)', fontsize=12, fontweight='bold')
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3)
-        ax.legend(fontsize=10)
+        ax.legend(handles=[handle], fontsize=10)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            self._savefig(fig, save_path)
             print(f"Saved Pareto frontier to {save_path}")
         
-        plt.show()
+        if show:
+            plt.show()
+        if owned:
+            plt.close(fig)
+    
+    def live_pareto_frontier(self,
+                             title: str = "Pareto Frontier: Size vs. Miss Rate",
+                             ax=None) -> _LivePareto:
+        """
+        Set up a Pareto frontier plot for interactive, repeated updates.
+        
+        Use instead of plot_pareto_frontier when the frontier changes over
+        time (e.g. during a running optimization): call update() or
+        update_points() on the returned object to redraw only the data.
+        
+        Parameters:
+        -----------
+        title : str
+            Plot title
+        ax : matplotlib.axes.Axes, optional
+            Existing Axes to clear and draw into instead of a new figure
+            
+        Returns:
+        --------
+        _LivePareto
+            Handle whose update methods replace the plotted frontier
+        """
+        fig, ax, _ = self._figure_axes(ax, self.figsize, self.dpi)
+        live = _LivePareto(ax)
+        
+        ax.set_xlabel('Cache Size (KB)', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Miss Rate (%)', fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        ax.legend(handles=[Line2D([], [], marker='o', linewidth=2,
+                                  markersize=8, color=live.line.get_color(),
+                                  label='Pareto Frontier')], fontsize=10)
+        fig.tight_layout()
+        return live
     
     def plot_multiple_pareto_frontiers(self, 
                                       workload_results: Dict[str, List[Dict]],
-                                      save_path: Optional[str] = None):
+                                      save_path: Optional[str] = None,
+                                      show: bool = True,
+                                      ax=None):
         """
         Plot Pareto frontiers for multiple workloads on same axes.
         
@@ -118,38 +415,68 @@ class SmartCacheVisualizer:
             Dict mapping workload names to their Pareto points
         save_path : str, optional
             Path to save figure
+        show : bool
+            Display the figure; figures created here are closed afterwards
+            either way
+        ax : matplotlib.axes.Axes, optional
+            Existing Axes to clear and draw into instead of creating a new
+            figure (e.g. to reuse one figure across many plots); the caller
+            keeps ownership of its figure
         """
-        fig, ax = plt.subplots(figsize=(12, 8), dpi=self.dpi)
+        fig, ax, owned = self._figure_axes(ax, (12, 8), self.dpi)
         
-        colors = plt.cm.tab10(np.linspace(0, 1, len(workload_results)))
+        # Distinct qualitative colors, cycling only beyond 20 workloads
+        cmap = plt.colormaps['tab20']
+        colors = cmap(np.arange(len(workload_results)) % cmap.N)
         
+        # Gather all frontiers so they are drawn as one line collection and
+        # one marker collection rather than a Line2D artist per workload
+        segments, segment_colors, handles = [], [], []
         for (workload_name, pareto_points), color in zip(workload_results.items(), colors):
             if not pareto_points:
                 continue
             
-            sizes = [p['cache_size'] / 1024 for p in pareto_points]
-            miss_rates = [p['miss_rate'] * 100 for p in pareto_points]
+            recs = _history_to_soa(pareto_points)
+            sizes, miss_rates = recs['size'] / 1024, recs['mr'] * 100
             
-            ax.plot(sizes, miss_rates, 'o-', linewidth=2, markersize=6,
-                   label=workload_name, color=color, alpha=0.8)
+            segments.append(np.column_stack([sizes, miss_rates]))
+            segment_colors.append(color)
+            handles.append(Line2D([], [], marker='o', linewidth=2,
+                                  markersize=6, color=color, alpha=0.8,
+                                  label=workload_name))
+        
+        if segments:
+            lines = LineCollection(segments, colors=segment_colors,
+                                   linewidths=2, alpha=0.8)
+            ax.add_collection(lines)
+            points = np.concatenate(segments)
+            point_colors = np.repeat(segment_colors,
+                                     [len(seg) for seg in segments], axis=0)
+            ax.scatter(points[:, 0], points[:, 1], s=36, c=point_colors,
+                      alpha=0.8, zorder=lines.get_zorder() + 1)
+            ax.autoscale_view()
         
         ax.set_xlabel('Cache Size (KB)', fontsize=12, fontweight='bold')
         ax.set_ylabel('Miss Rate (%)', fontsize=12, fontweight='bold')
         ax.set_title('Pareto Frontiers Across Workloads', 
                     fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3)
-        ax.legend(fontsize=9, loc='best')
+        ax.legend(handles=handles, fontsize=9, loc='best')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            self._savefig(fig, save_path)
             print(f"Saved multi-Pareto plot to {save_path}")
         
-        plt.show()
+        if show:
+            plt.show()
+        if owned:
+            plt.close(fig)
     
     def plot_ai_vs_baseline_comparison(self, comparison_results: Dict,
-                                      save_path: Optional[str] = None):
+                                      save_path: Optional[str] = None,
+                                      show: bool = True):
         """
         Bar chart comparing AI-optimized vs. best baseline for each workload.
         
@@ -161,6 +488,8 @@ class SmartCacheVisualizer:
             Results from experiment_framework.compare_performance()
         save_path : str, optional
             Path to save figure
+        show : bool
+            Display the figure; it is closed afterwards either way
         """
         if not comparison_results:
             print("WARNING: No comparison results to plot")
@@ -169,12 +498,12 @@ class SmartCacheVisualizer:
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10), dpi=self.dpi)
         
         workloads = list(comparison_results.keys())
-        ai_miss_rates = [comparison_results[w]['ai_miss_rate'] * 100 
-                        for w in workloads]
-        baseline_miss_rates = [comparison_results[w]['best_baseline_miss_rate'] * 100
-                              for w in workloads]
-        improvements = [comparison_results[w]['relative_improvement_pct']
-                       for w in workloads]
+        cols = np.array([(r['ai_miss_rate'], r['best_baseline_miss_rate'],
+                          r['relative_improvement_pct'])
+                         for r in comparison_results.values()], dtype=float)
+        ai_miss_rates = cols[:, 0] * 100
+        baseline_miss_rates = cols[:, 1] * 100
+        improvements = cols[:, 2]
         
         x = np.arange(len(workloads))
         width = 0.35
@@ -196,11 +525,7 @@ class SmartCacheVisualizer:
         
         # Add value labels on bars
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{height:.1f}%',
-                        ha='center', va='bottom', fontsize=8)
+            ax1.bar_label(bars, fmt='%.1f%%', fontsize=8)
         
         # Plot 2: Improvement percentage
         colors = ['#06A77D' if imp > 0 else '#E63946' for imp in improvements]
@@ -215,25 +540,24 @@ class SmartCacheVisualizer:
         ax2.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
         ax2.grid(True, alpha=0.3, axis='y')
         
-        # Add value labels
-        for bar in bars3:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:+.1f}%',
-                    ha='center', va='bottom' if height > 0 else 'top',
-                    fontsize=9, fontweight='bold')
+        # Add value labels (placed below negative bars)
+        ax2.bar_label(bars3, fmt='%+.1f%%', fontsize=9, fontweight='bold')
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            self._savefig(fig, save_path)
             print(f"Saved comparison plot to {save_path}")
         
-        plt.show()
+        if show:
+            plt.show()
+        plt.close(fig)
     
     def plot_optimization_convergence(self, optimization_history: List[Dict],
                                      title: str = "Bayesian Optimization Convergence",
-                                     save_path: Optional[str] = None):
+                                     save_path: Optional[str] = None,
+                                     show: bool = True,
+                                     ax=None):
         """
         Plot convergence of Bayesian optimization over iterations.
         
@@ -251,22 +575,24 @@ class SmartCacheVisualizer:
             Plot title
         save_path : str, optional
             Path to save figure
+        show : bool
+            Display the figure; figures created here are closed afterwards
+            either way
+        ax : matplotlib.axes.Axes, optional
+            Existing Axes to clear and draw into instead of creating a new
+            figure (e.g. to reuse one figure across many plots); the caller
+            keeps ownership of its figure
         """
         if not optimization_history:
             print("WARNING: No history to plot")
             return
         
-        fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+        fig, ax, owned = self._figure_axes(ax, self.figsize, self.dpi)
         
-        iterations = list(range(1, len(optimization_history) + 1))
-        miss_rates = [h['miss_rate'] * 100 for h in optimization_history]
-        
-        # Calculate cumulative minimum (best so far)
-        best_so_far = []
-        current_best = float('inf')
-        for mr in miss_rates:
-            current_best = min(current_best, mr)
-            best_so_far.append(current_best)
+        # Miss rates and cumulative minimum (best so far), extended
+        # incrementally when the same history is re-plotted after appends
+        miss_rates, best_so_far = self._convergence_arrays(optimization_history)
+        iterations = np.arange(1, len(miss_rates) + 1)
         
         # Plot all evaluations
         ax.scatter(iterations, miss_rates, alpha=0.3, s=30,
@@ -289,21 +615,23 @@ class SmartCacheVisualizer:
                    xytext=(-60, 20),
                    textcoords='offset points',
                    fontsize=10, fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.5', 
-                            facecolor='yellow', alpha=0.7),
-                   arrowprops=dict(arrowstyle='->', 
-                                  connectionstyle='arc3,rad=0'))
+                   bbox=_BEST_LABEL_BBOX,
+                   arrowprops=_BEST_LABEL_ARROW)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            self._savefig(fig, save_path)
             print(f"Saved convergence plot to {save_path}")
         
-        plt.show()
+        if show:
+            plt.show()
+        if owned:
+            plt.close(fig)
     
     def plot_design_space_exploration(self, optimization_history: List[Dict],
-                                     save_path: Optional[str] = None):
+                                     save_path: Optional[str] = None,
+                                     show: bool = True):
         """
         2D scatter plot showing explored cache configurations.
         
@@ -321,6 +649,8 @@ class SmartCacheVisualizer:
             History of evaluated configurations
         save_path : str, optional
             Path to save figure
+        show : bool
+            Display the figure; it is closed afterwards either way
         """
         if not optimization_history:
             print("WARNING: No history to plot")
@@ -328,21 +658,36 @@ class SmartCacheVisualizer:
         
         fig, ax = plt.subplots(figsize=(12, 8), dpi=self.dpi)
         
-        sizes = [h['cache_size'] / 1024 for h in optimization_history]
-        miss_rates = [h['miss_rate'] * 100 for h in optimization_history]
-        assocs = [h['associativity'] for h in optimization_history]
-        iterations = list(range(len(optimization_history)))
-        
-        # Scatter plot with multiple dimensions encoded
-        scatter = ax.scatter(sizes, miss_rates, c=assocs, s=[20 + i*2 for i in iterations],
-                           alpha=0.6, cmap='viridis', edgecolors='black', linewidth=0.5)
+        recs = _history_to_soa(optimization_history)
+        sizes = recs['size'] / 1024
+        miss_rates = recs['mr'] * 100
+        assocs = recs['assoc']
+        marker_sizes = 20 + 2 * np.arange(len(recs))
+        best_idx = int(miss_rates.argmin())
+        
+        # Very long histories saturate the plot; draw an even sample
+        n_total = len(recs)
+        note = 'Marker size ∝ iteration number'
+        shown = slice(None)
+        if n_total > _MAX_SCATTER_POINTS:
+            shown = np.union1d(
+                np.linspace(0, n_total - 1, _MAX_SCATTER_POINTS, dtype=int),
+                [best_idx])
+            note += f'\n{len(shown)} of {n_total} evaluations shown'
+        
+        # Scatter plot with multiple dimensions encoded; the point cloud is
+        # rasterized so vector output (PDF/SVG) stays small for long
+        # histories, while axes, text and the best-point star stay vector
+        scatter = ax.scatter(sizes[shown], miss_rates[shown], c=assocs[shown],
+                           s=marker_sizes[shown], vmin=assocs.min(), vmax=assocs.max(),
+                           alpha=0.6, cmap='viridis', edgecolors='black', linewidth=0.5,
+                           rasterized=True)
         
         # Color bar for associativity
         cbar = plt.colorbar(scatter, ax=ax, label='Associativity')
         cbar.set_label('Associativity (N-way)', fontsize=11, fontweight='bold')
         
         # Highlight best point
-        best_idx = np.argmin(miss_rates)
         ax.scatter([sizes[best_idx]], [miss_rates[best_idx]], 
                   s=400, marker='*', color='red', 
                   edgecolors='black', linewidth=2,
@@ -356,24 +701,29 @@ class SmartCacheVisualizer:
         ax.legend(fontsize=10, loc='upper right')
         
         # Add note about marker size
-        ax.text(0.02, 0.98, 'Marker size ∝ iteration number',
+        ax.text(0.02, 0.98, note,
                transform=ax.transAxes, fontsize=9, verticalalignment='top',
-               bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+               bbox=_NOTE_BBOX)
         
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=self.dpi, bbox_inches='tight')
+            self._savefig(fig, save_path)
             print(f"Saved design space plot to {save_path}")
         
-        plt.show()
+        if show:
+            plt.show()
+        plt.close(fig)
     
     def create_summary_report(self, results_file: str = 'experiment_results.json',
-                             output_dir: str = 'plots'):
+                             output_dir: str = 'plots',
+                             max_workers: int = None):
         """
         Generate complete set of visualizations from saved results.
         
-        Creates publication-ready figures for all key analyses.
+        Creates publication-ready figures for all key analyses. The
+        per-workload figures are independent and are rendered in parallel
+        worker processes.
         
         Parameters:
         -----------
@@ -381,34 +731,56 @@ class SmartCacheVisualizer:
             Path to JSON results file
         output_dir : str
             Directory to save plots
+        max_workers : int, optional
+            Worker processes to use; defaults to one per figure, capped at
+            the CPU count. 1 renders the figures in this process
         """
-        import os
         os.makedirs(output_dir, exist_ok=True)
         
         print("="*70)
         print("GENERATING VISUALIZATION SUMMARY REPORT")
         print("="*70)
         
-        # Load results
-        with open(results_file, 'r') as f:
-            results = json.load(f)
+        # Load results, keeping only each workload's Pareto frontier
+        jobs = []
+        n_workloads = 0
+        for workload_name, opt_result in _iter_optimized_results(results_file):
+            n_workloads += 1
+            if opt_result['pareto_frontier']:
+                jobs.append((opt_result['pareto_frontier'],
+                             f'Pareto Frontier: {workload_name}',
+                             os.path.join(output_dir,
+                                          f'pareto_{workload_name}.png')))
         
         print(f"\nLoaded results from {results_file}")
-        print(f"   Workloads: {len(results['optimized'])}")
+        print(f"   Workloads: {n_workloads}")
         print(f"   Output directory: {output_dir}\n")
         
         # Plot Pareto frontiers for each workload
         print("Generating Pareto frontier plots...")
-        for workload_name, opt_result in results['optimized'].items():
-            pareto_points = opt_result['pareto_frontier']
-            if pareto_points:
-                save_path = os.path.join(output_dir, 
-                                        f'pareto_{workload_name}.png')
-                self.plot_pareto_frontier(
-                    pareto_points,
-                    title=f'Pareto Frontier: {workload_name}',
-                    save_path=save_path
-                )
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+        if max_workers <= 1:
+            # One figure, cleared and redrawn for every workload
+            fig, ax = plt.subplots(figsize=self.figsize, dpi=self.dpi)
+            try:
+                for pareto_points, title, save_path in jobs:
+                    self.plot_pareto_frontier(pareto_points, title=title,
+                                              save_path=save_path,
+                                              show=False, ax=ax)
+            finally:
+                plt.close(fig)
+        else:
+            # Spawned workers: forking after the experiment has run
+            # parallel trace kernels in this process can hang it at exit
+            ctx = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=ctx) as executor:
+                futures = [executor.submit(_render_pareto_task, self.figsize,
+                                           self.dpi, *job)
+                           for job in jobs]
+                for future in futures:
+                    future.result()
         
         print("\nVisualization report complete!")
         print(f"   All plots saved to {output_dir}/")